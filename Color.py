@@ -109,11 +109,7 @@ class Color:
             g = 0.0
             b = 0.0
 
-            finalRatio = ratio;
-            if (finalRatio < 0.0):
-                finalRatio = 0.0
-            elif(finalRatio > 1.0):
-                finalRatio = 1.0
+            finalRatio = min(max(ratio, 0.0), 1.0)
 
             if (finalRatio >= 0.0 and finalRatio <= 0.25):
                 r = 0.0
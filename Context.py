@@ -1,9 +1,64 @@
 import topologicpy
 import topologic
+from operator import methodcaller
+from functools import lru_cache
+from itertools import count, repeat
+import numpy as np
+import weakref
+from typing import Optional
+
+# Bind the underlying calls once at import time rather than on every call.
+_BY_TOPOLOGY_PARAMETERS = topologic.Context.ByTopologyParameters
+_TOPOLOGY = methodcaller("Topology")
+
+# Each live topology is assigned a token that is never reused, so the cache
+# cannot return a stale context when CPython recycles an id. The cache itself is
+# functools.lru_cache, which stays consistent under concurrent callers without
+# a lock of our own (including on free-threaded builds). The cache is kept in
+# memory only: a context has no serialized form of its own and rebuilding one
+# from its topology is cheaper than deserializing that topology from disk.
+_CONTEXT_CACHE_SIZE = 4096
+_tokenCounter = count()
+_topologyTokens = {} # id(topology) -> token
+_tokenTopologies = weakref.WeakValueDictionary() # token -> topology
+
+# Contexts created with the default parameters are by far the most common, so
+# they are also kept in a flyweight map keyed by token that stays valid for as
+# long as the context is alive, independently of LRU eviction.
+_DEFAULT_UVW = (0.5, 0.5, 0.5)
+_defaultContexts = weakref.WeakValueDictionary()
+
+def _validateUVW(u: float, v: float, w: float) -> Optional[tuple]:
+    # Clamps the parameters to [0, 1]. Returns None if any of them is not a number.
+    try:
+        u, v, w = float(u), float(v), float(w)
+    except (TypeError, ValueError):
+        return None
+    if u != u or v != v or w != w: # NaN
+        return None
+    return (min(max(u, 0.0), 1.0), min(max(v, 0.0), 1.0), min(max(w, 0.0), 1.0))
+
+def _topologyToken(topology: topologic.Topology) -> Optional[int]:
+    # Returns the cache token of the input topology or None if it cannot be tracked.
+    topologyID = id(topology)
+    token = _topologyTokens.get(topologyID)
+    if token is None:
+        token = next(_tokenCounter)
+        try:
+            _tokenTopologies[token] = topology
+        except TypeError: # The topology does not support weak references
+            return None
+        weakref.finalize(topology, _topologyTokens.pop, topologyID, None)
+        _topologyTokens[topologyID] = token
+    return token
+
+@lru_cache(maxsize=_CONTEXT_CACHE_SIZE)
+def _cachedContext(token: int, u: float, v: float, w: float) -> topologic.Context:
+    return _BY_TOPOLOGY_PARAMETERS(_tokenTopologies[token], u, v, w)
 
 class Context:
     @staticmethod
-    def ByTopologyParameters(topology, u = 0.5, v = 0.5, w = 0.5):
+    def ByTopologyParameters(topology: topologic.Topology, u: float = 0.5, v: float = 0.5, w: float = 0.5) -> Optional[topologic.Context]:
         """
         Creates a context object represented by the input topology.
 
@@ -12,11 +67,11 @@ class Context:
         topology : topologic.Topology
             The input topology.
         u : float , optional
-            The input *u* parameter. This defines the relative parameteric location of the content object along the *u* axis.
-        v : TYPE
-            The input *v* parameter. This defines the relative parameteric location of the content object along the *v* axis..
-        w : TYPE
-            The input *w* parameter. This defines the relative parameteric location of the content object along the *w* axis.
+            The input *u* parameter. This defines the relative parameteric location of the content object along the *u* axis. It is clamped to the range [0, 1].
+        v : float , optional
+            The input *v* parameter. This defines the relative parameteric location of the content object along the *v* axis. It is clamped to the range [0, 1].
+        w : float , optional
+            The input *w* parameter. This defines the relative parameteric location of the content object along the *w* axis. It is clamped to the range [0, 1].
 
         Returns
         -------
@@ -24,16 +79,152 @@ class Context:
             The created context object. See Aperture.ByObjectContext.
 
         """
-
-        context = None
+        if not isinstance(topology, topologic.Topology):
+            return None
+        uvw = _validateUVW(u, v, w)
+        if uvw is None:
+            return None
+        token = _topologyToken(topology)
+        if token is None:
+            try:
+                return _BY_TOPOLOGY_PARAMETERS(topology, *uvw)
+            except (RuntimeError, TypeError):
+                return None
+        if uvw == _DEFAULT_UVW:
+            context = _defaultContexts.get(token)
+            if context is not None:
+                return context
         try:
-            context = topologic.Context.ByTopologyParameters(topology, u, v, w)
-        except:
-            context = None
+            context = _cachedContext(token, *uvw)
+        except (RuntimeError, TypeError):
+            return None
+        if uvw == _DEFAULT_UVW:
+            try:
+                _defaultContexts[token] = context
+            except TypeError: # The context does not support weak references
+                pass
         return context
     
     @staticmethod
-    def Topology(context):
+    def ByTopologyParametersMany(topologies: list, us: float = 0.5, vs: float = 0.5, ws: float = 0.5) -> list:
+        """
+        Creates a list of context objects represented by the input list of topologies, with one set of parameters per topology or one set shared by all of them.
+
+        Parameters
+        ----------
+        topologies : list
+            The input list of topologies.
+        us : float or list or numpy.ndarray , optional
+            The input *u* parameter(s). If a single number is given, it is used for all topologies. Otherwise, the list or array must have the same length as the list of topologies, or a length of 1. The default is 0.5.
+        vs : float or list or numpy.ndarray , optional
+            The input *v* parameter(s). If a single number is given, it is used for all topologies. Otherwise, the list or array must have the same length as the list of topologies, or a length of 1. The default is 0.5.
+        ws : float or list or numpy.ndarray , optional
+            The input *w* parameter(s). If a single number is given, it is used for all topologies. Otherwise, the list or array must have the same length as the list of topologies, or a length of 1. The default is 0.5.
+
+        Returns
+        -------
+        list
+            The list of created context objects. Invalid entries are returned as None. See Context.ByTopologyParameters.
+
+        """
+        if not isinstance(topologies, list):
+            print("Context.ByTopologyParametersMany - Error: The input list of topologies is not a valid list. Returning None.")
+            return None
+        n = len(topologies)
+        parameters = []
+        for p in [us, vs, ws]:
+            try:
+                isSequence = isinstance(p, (list, tuple)) or np.ndim(p) > 0
+                if isSequence:
+                    # Lists, tuples and numpy arrays are broadcast to one value per topology.
+                    p = np.broadcast_to(np.asarray(p), (n,)).tolist()
+            except ValueError:
+                print("Context.ByTopologyParametersMany - Error: The input list of parameters does not match the length of the input list of topologies. Returning None.")
+                return None
+            parameters.append(p if isSequence else repeat(p, n))
+        # Each context goes through the context cache and the default-parameter flyweight, like Context.ByTopologyParameters.
+        byTopologyParameters = Context.ByTopologyParameters
+        return [byTopologyParameters(t, u, v, w) for t, u, v, w in zip(topologies, *parameters)]
+    
+    @staticmethod
+    def ByTopologyParametersUnchecked(topology: topologic.Topology, u: float = 0.5, v: float = 0.5, w: float = 0.5) -> topologic.Context:
+        """
+        Creates a context object represented by the input topology without validating the inputs or using the context cache. Use this in tight loops where the inputs are already known to be valid. Unlike Context.ByTopologyParameters, errors are raised rather than returning None.
+
+        Parameters
+        ----------
+        topology : topologic.Topology
+            The input topology. This must be a valid topology.
+        u : float , optional
+            The input *u* parameter. This must be a float in the range [0, 1]. The default is 0.5.
+        v : float , optional
+            The input *v* parameter. This must be a float in the range [0, 1]. The default is 0.5.
+        w : float , optional
+            The input *w* parameter. This must be a float in the range [0, 1]. The default is 0.5.
+
+        Returns
+        -------
+        topologic.Context
+            The created context object. See Aperture.ByObjectContext.
+
+        """
+        return _BY_TOPOLOGY_PARAMETERS(topology, u, v, w)
+    
+    @staticmethod
+    def ByTopologyParametersUVW(topology: topologic.Topology, uvw: tuple = _DEFAULT_UVW) -> Optional[topologic.Context]:
+        """
+        Creates a context object represented by the input topology and a single (u, v, w) tuple. In tight loops, pass the same tuple (or numpy array) on every call instead of building new parameters each time.
+
+        Parameters
+        ----------
+        topology : topologic.Topology
+            The input topology.
+        uvw : tuple , optional
+            The input (*u*, *v*, *w*) parameters. See Context.ByTopologyParameters. The default is (0.5, 0.5, 0.5).
+
+        Returns
+        -------
+        topologic.Context
+            The created context object. See Aperture.ByObjectContext.
+
+        """
+        try:
+            u, v, w = uvw
+        except (TypeError, ValueError):
+            print("Context.ByTopologyParametersUVW - Error: The input uvw parameter is not a valid (u, v, w) tuple. Returning None.")
+            return None
+        return Context.ByTopologyParameters(topology, u, v, w)
+    
+    @staticmethod
+    def Release(context: topologic.Context) -> bool:
+        """
+        Releases the input default-parameter context from the context cache so that Context.ByTopologyParameters no longer returns it and it can be freed once the caller drops it. Call this when a context created by Context.ByTopologyParameters is no longer needed.
+
+        Parameters
+        ----------
+        context : topologic.Context
+            The input context.
+
+        Returns
+        -------
+        bool
+            True if the input context was found in the cache and released. False otherwise. Contexts created with non-default parameters are not tracked individually and age out of the cache instead.
+
+        """
+        if not isinstance(context, topologic.Context):
+            return False
+        tokens = [t for t, c in list(_defaultContexts.items()) if c is context]
+        for token in tokens:
+            # lru_cache cannot drop single entries, so retire the token instead.
+            # The cached entry becomes unreachable and is evicted in due course.
+            _defaultContexts.pop(token, None)
+            topology = _tokenTopologies.pop(token, None)
+            if topology is not None:
+                _topologyTokens.pop(id(topology), None)
+        return len(tokens) > 0
+    
+    @staticmethod
+    def Topology(context: topologic.Context) -> Optional[topologic.Topology]:
         """
         Returns the topology of the input context.
         
@@ -48,9 +239,33 @@ class Context:
             The topology of the input context.
 
         """
-        topology = None
+        if not isinstance(context, topologic.Context):
+            return None
+        try:
+            return _TOPOLOGY(context)
+        except (RuntimeError, TypeError):
+            return None
+    
+    @staticmethod
+    def TopologyMany(contexts: list) -> list:
+        """
+        Returns the topologies of the input list of contexts. This is faster than calling Context.Topology in a loop.
+
+        Parameters
+        ----------
+        contexts : list
+            The input list of contexts.
+
+        Returns
+        -------
+        list
+            The list of topologies of the input contexts. Invalid entries are returned as None.
+
+        """
+        if not isinstance(contexts, list):
+            print("Context.TopologyMany - Error: The input list of contexts is not a valid list. Returning None.")
+            return None
         try:
-            topology = context.Topology()
-        except:
-            topology = None
-        return topology
+            return list(map(_TOPOLOGY, contexts))
+        except Exception:
+            return [Context.Topology(c) for c in contexts]
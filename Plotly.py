@@ -2,15 +2,231 @@ import topologicpy
 import topologic
 import plotly
 import plotly.graph_objects as go
-from topologicpy.Vertex import Vertex
-from topologicpy.Edge import Edge
-from topologicpy.Wire import Wire
-from topologicpy.Face import Face
-from topologicpy.Cell import Cell
-from topologicpy.CellComplex import CellComplex
-from topologicpy.Cluster import Cluster
-from topologicpy.Topology import Topology
+import os
+from topologicpy.Dictionary import Dictionary # Lightweight. The geometry classes are imported where they are used.
 import numpy as np
+from functools import lru_cache
+from itertools import chain
+from collections import namedtuple
+import inspect
+from sys import intern # Repeated labels share one string object across traces.
+try:
+    import orjson # Optional. Parses and serializes figure JSON much faster than the json module.
+except ImportError:
+    orjson = None
+
+@lru_cache(maxsize=4096)
+def _rgbByValueInRange(value, minValue, maxValue, colorScale):
+    # Many elements share few group values, so cache the color lookup and its string form.
+    from topologicpy.Color import Color
+    color = Color.ByValueInRange(value, minValue=minValue, maxValue=maxValue, colorScale=colorScale)
+    return f"rgb({color[0]},{color[1]},{color[2]})"
+
+def _rgbByValuesInRange(values, minValue, maxValue, colorScale, bins=256):
+    # Returns the rgb strings of the input numeric values. The values are quantized to the input number of bins across
+    # the range so that each distinct color is computed only once, however many values there are.
+    values = np.clip(np.asarray(values, dtype=float), minValue, maxValue)
+    if not maxValue > minValue:
+        return [_rgbByValueInRange(v, minValue, maxValue, colorScale) for v in values.tolist()]
+    step = (maxValue - minValue)/(bins - 1)
+    indices = np.rint((values - minValue)/step).astype(int)
+    table = {i: _rgbByValueInRange(minValue + i*step, minValue, maxValue, colorScale) for i in np.unique(indices).tolist()}
+    return [table[i] for i in indices.tolist()]
+
+_dictionaryValueAtKey = Dictionary.ValueAtKey
+
+def _valueAtKey(dictionary, key, defaultValue=None):
+    # Returns the value at the input key, or the default value if the dictionary, the key, or its value is missing.
+    if key is None or not dictionary:
+        return defaultValue
+    try:
+        value = _dictionaryValueAtKey(dictionary, key)
+    except Exception:
+        return defaultValue
+    return defaultValue if value is None else value
+
+# NumPy scalars count as numbers so that groups read from arrays take the numeric color path.
+_NUMERIC_TYPES = (int, float, np.integer, np.floating)
+
+def _isUniform(values):
+    # Returns True if the input list has fewer than two distinct values. Unlike building a set, this stops at the first
+    # differing value and allocates nothing.
+    return all(value == values[0] for value in values) if values else True
+
+def _groupIndex(groups):
+    # Maps each group to the index of its first occurrence, matching list.index, for O(1) lookups.
+    index = {}
+    for i, group in enumerate(groups or []):
+        index.setdefault(group, i)
+    return index
+
+def _groupColors(count, dictionaries, labelKey, groupKey, minGroup, maxGroup, groups, colorScale, color):
+    # Returns the labels and the colors of the input number of elements from their dictionaries, and the last color
+    # assigned. Each group value is checked on its own: numbers are colored by value and converted in one batch,
+    # anything else by its position in the input groups. Values that cannot be colored get len(groups).
+    if not groups:
+        minGroup = 0
+        maxGroup = 1
+    elif isinstance(groups[0], _NUMERIC_TYPES):
+        if not minGroup:
+            minGroup = min(groups)
+        if not maxGroup:
+            maxGroup = max(groups)
+    else:
+        minGroup = 0
+        maxGroup = len(groups) - 1
+    groupIndex = _groupIndex(groups)
+    valueAtKey = _valueAtKey # Local name for the per-element loop; keys that are not set are not looked up.
+    labels = []
+    groupList = []
+    numericPositions = []
+    numericGroups = []
+    lastColored = None
+    if len(dictionaries) > 0:
+        for m in range(count):
+            label = ""
+            group = ""
+            d = dictionaries[m]
+            if d:
+                if labelKey:
+                    label = str(valueAtKey(d, labelKey, ""))
+                group = (valueAtKey(d, groupKey) or None) if groupKey else None
+            if isinstance(group, _NUMERIC_TYPES) and not isinstance(group, bool):
+                numericGroups.append(float(group))
+                numericPositions.append(len(groupList))
+                groupList.append(None) # Colored below in one batch
+                lastColored = len(groupList) - 1
+            else:
+                try:
+                    groupList.append(_rgbByValueInRange(groupIndex[group], minGroup, maxGroup, colorScale))
+                    lastColored = len(groupList) - 1
+                except (KeyError, TypeError): # Missing, unknown, or unhashable group
+                    groupList.append(len(groups))
+            labels.append(intern(label))
+    if len(numericGroups) > 0:
+        for n, c in zip(numericPositions, _rgbByValuesInRange(numericGroups, minGroup, maxGroup, colorScale)):
+            groupList[n] = c
+    if lastColored != None:
+        color = groupList[lastColored]
+    return labels, groupList, color
+
+# One Kaleido scope is started on the first image export and reused by all later ones, so that each export does not
+# pay for starting the Kaleido subprocess. It is None until first used and False if this Kaleido has no PlotlyScope.
+_kaleidoScope = None
+
+def _getKaleidoScope():
+    global _kaleidoScope
+    if _kaleidoScope is None:
+        try:
+            from kaleido.scopes.plotly import PlotlyScope
+            _kaleidoScope = PlotlyScope() # Shuts its subprocess down at exit
+        except Exception:
+            _kaleidoScope = False
+    return _kaleidoScope
+
+def _writeImage(figure, path, format, width, height, scale=1, figureDict=None):
+    # Writes the input figure to an image file through the shared Kaleido scope, or through plotly.io if there is none.
+    # Several exports of the same figure can pass the figure dict, so that the figure is only converted once.
+    scope = _getKaleidoScope()
+    if not scope:
+        plotly.io.write_image(figure if figureDict is None else figureDict, path, format=format, scale=scale, width=width, height=height, validate=True, engine='auto')
+        return
+    if figureDict is None:
+        figureDict = figure.to_dict()
+    image = scope.transform(figureDict, format=format, width=width, height=height, scale=scale)
+    with open(path, "wb") as f:
+        f.write(image)
+
+@lru_cache(maxsize=64)
+def _figureByJSONPath(path, mtime, size):
+    # Parses the JSON figure at the input path. The modification time and size are part of the cache key, so that an
+    # edited file is parsed again.
+    with open(path, "rb") as file:
+        return _figureByJSON(file.read())
+
+def _figureByJSON(data):
+    # Returns the plotly figure of the input JSON text or bytes. orjson reads bytes directly, without decoding them first.
+    if orjson is None:
+        return plotly.io.from_json(data, output_type='Figure', skip_invalid=True)
+    return go.Figure(orjson.loads(data), skip_invalid=True)
+
+def _figureJSON(figure):
+    # Returns the input figure as compact JSON bytes, without trace uids. orjson encodes NumPy arrays natively, so
+    # they are not converted to lists first. Anything orjson cannot encode falls back to plotly's own encoder.
+    figureDict = figure.to_plotly_json() # A deep copy, so the uids can be removed in place.
+    for trace in figureDict.get("data", []):
+        trace.pop("uid", None)
+    if orjson is not None:
+        try:
+            return orjson.dumps(figureDict, option=orjson.OPT_SERIALIZE_NUMPY)
+        except TypeError:
+            pass
+    return plotly.io.to_json(figureDict, validate=False, pretty=False).encode()
+
+# The named CSS colors that plotly can use.
+_COLORS = ("aliceblue","antiquewhite","aqua",
+           "aquamarine","azure","beige",
+           "bisque","black","blanchedalmond",
+           "blue","blueviolet","brown",
+           "burlywood","cadetblue",
+           "chartreuse","chocolate",
+           "coral","cornflowerblue","cornsilk",
+           "crimson","cyan","darkblue",
+           "darkcyan","darkgoldenrod","darkgray",
+           "darkgrey","darkgreen","darkkhaki",
+           "darkmagenta","darkolivegreen","darkorange",
+           "darkorchid","darkred","darksalmon",
+           "darkseagreen","darkslateblue","darkslategray",
+           "darkslategrey","darkturquoise","darkviolet",
+           "deeppink","deepskyblue","dimgray",
+           "dimgrey","dodgerblue","firebrick",
+           "floralwhite","forestgreen","fuchsia",
+           "gainsboro","ghostwhite","gold",
+           "goldenrod","gray","grey",
+           "green","greenyellow","honeydew",
+           "hotpink","indianred","indigo",
+           "ivory","khaki","lavender",
+           "lavenderblush","lawngreen","lemonchiffon",
+           "lightblue","lightcoral","lightcyan",
+           "lightgoldenrodyellow","lightgray","lightgrey",
+           "lightgreen","lightpink","lightsalmon",
+           "lightseagreen","lightskyblue","lightslategray",
+           "lightslategrey","lightsteelblue","lightyellow",
+           "lime","limegreen","linen",
+           "magenta","maroon","mediumaquamarine",
+           "mediumblue","mediumorchid","mediumpurple",
+           "mediumseagreen","mediumslateblue","mediumspringgreen",
+           "mediumturquoise","mediumvioletred","midnightblue",
+           "mintcream","mistyrose","moccasin",
+           "navajowhite","navy","oldlace",
+           "olive","olivedrab","orange",
+           "orangered","orchid","palegoldenrod",
+           "palegreen","paleturquoise","palevioletred",
+           "papayawhip","peachpuff","peru",
+           "pink","plum","powderblue",
+           "purple","red","rosybrown",
+           "royalblue","rebeccapurple","saddlebrown",
+           "salmon","sandybrown","seagreen",
+           "seashell","sienna","silver",
+           "skyblue","slateblue","slategray",
+           "slategrey","snow","springgreen",
+           "steelblue","tan","teal",
+           "thistle","tomato","turquoise",
+           "violet","wheat","white",
+           "whitesmoke","yellow","yellowgreen")
+_COLORS_SET = frozenset(_COLORS)
+
+# The FigureByData layout hides all axes. plotly copies layout inputs, so these are shared read-only by every figure.
+_HIDDEN_SCENE = {"xaxis": {"visible": False}, "yaxis": {"visible": False}, "zaxis": {"visible": False}, "aspectmode": "data"}
+_HIDDEN_AXIS = {"showgrid": False, "zeroline": False, "visible": False}
+
+# The plotly renderers that Plotly.Show accepts.
+_RENDERERS = ('plotly_mimetype', 'jupyterlab', 'nteract', 'vscode',
+              'notebook', 'notebook_connected', 'kaggle', 'azure', 'colab',
+              'cocalc', 'databricks', 'json', 'png', 'jpeg', 'jpg', 'svg',
+              'pdf', 'browser', 'firefox', 'chrome', 'chromium', 'iframe',
+              'iframe_connected', 'sphinx_gallery', 'sphinx_gallery_png', 'offline')
+_RENDERERS_SET = frozenset(_RENDERERS)
 
 class Plotly:
     @staticmethod
@@ -51,13 +267,12 @@ class Plotly:
         if not isinstance(figure, plotly.graph_objs._figure.Figure):
             return None
         if units:
-            units = "Units: "+units
-        minValue = min(values)
-        maxValue = max(values)
-        step = (maxValue - minValue)/float(nTicks-1)
-        r = [round(minValue+i*step, mantissa) for i in range(nTicks)]
-        r[-1] = round(maxValue, mantissa)
-                # Define the minimum and maximum range of the colorbar
+            units = f"Units: {units}"
+        # Define the minimum and maximum range of the colorbar
+        values = np.asarray(values, dtype=float)
+        minValue = float(values.min())
+        maxValue = float(values.max())
+        r = np.round(np.linspace(minValue, maxValue, nTicks), mantissa).tolist()
         rs = [str(x) for x in r]
 
         # Define the colorbar as a trace with no data, x or y coordinates
@@ -74,7 +289,7 @@ class Plotly:
                 color=['rgba(0,0,0,0)'],
                 colorbar=dict(
                     x=xPosition,
-                    title="<b>"+title+"</b><br>"+subTitle+"<br>"+units, # title of the colorbar
+                    title=f"<b>{title}</b><br>{subTitle}<br>{units}", # title of the colorbar
                     ticks="outside", # position of the ticks
                     tickvals=r, # values of the ticks
                     ticktext=rs, # text of the ticks
@@ -98,57 +313,7 @@ class Plotly:
         list
             The list of named CSS colors.
         """
-        return ["aliceblue","antiquewhite","aqua",
-                "aquamarine","azure","beige",
-                "bisque","black","blanchedalmond",
-                "blue","blueviolet","brown",
-                "burlywood","cadetblue",
-                "chartreuse","chocolate",
-                "coral","cornflowerblue","cornsilk",
-                "crimson","cyan","darkblue",
-                "darkcyan","darkgoldenrod","darkgray",
-                "darkgrey","darkgreen","darkkhaki",
-                "darkmagenta","darkolivegreen","darkorange",
-                "darkorchid","darkred","darksalmon",
-                "darkseagreen","darkslateblue","darkslategray",
-                "darkslategrey","darkturquoise","darkviolet",
-                "deeppink","deepskyblue","dimgray",
-                "dimgrey","dodgerblue","firebrick",
-                "floralwhite","forestgreen","fuchsia",
-                "gainsboro","ghostwhite","gold",
-                "goldenrod","gray","grey",
-                "green"," greenyellow","honeydew",
-                "hotpink","indianred","indigo",
-                "ivory","khaki","lavender",
-                "lavenderblush","lawngreen","lemonchiffon",
-                "lightblue","lightcoral","lightcyan",
-                "lightgoldenrodyellow","lightgray","lightgrey",
-                "lightgreen","lightpink","lightsalmon",
-                "lightseagreen","lightskyblue","lightslategray",
-                "lightslategrey","lightsteelblue","lightyellow",
-                "lime","limegreen","linen",
-                "magenta","maroon","mediumaquamarine",
-                "mediumblue","mediumorchid","mediumpurple",
-                "mediumseagreen","mediumslateblue","mediumspringgreen",
-                "mediumturquoise","mediumvioletred","midnightblue",
-                "mintcream","mistyrose","moccasin",
-                "navajowhite","navy","oldlace",
-                "olive","olivedrab","orange",
-                "orangered","orchid","palegoldenrod",
-                "palegreen","paleturquoise","palevioletred",
-                "papayawhip","peachpuff","peru",
-                "pink","plum","powderblue",
-                "purple","red","rosybrown",
-                "royalblue","rebeccapurple","saddlebrown",
-                "salmon","sandybrown","seagreen",
-                "seashell","sienna","silver",
-                "skyblue","slateblue","slategray",
-                "slategrey","snow","springgreen",
-                "steelblue","tan","teal",
-                "thistle","tomato","turquoise",
-                "violet","wheat","white",
-                "whitesmoke","yellow","yellowgreen"]
-
+        return list(_COLORS)
 
     @staticmethod
     def DataByDGL(data, labels):
@@ -183,7 +348,7 @@ class Plotly:
         return df
 
     @staticmethod
-    def DataByGraph(graph, vertexColor="black", vertexSize=6, vertexLabelKey=None, vertexGroupKey=None, vertexGroups=[], showVertices=True, showVertexLegend=False, edgeColor="black", edgeWidth=1, edgeLabelKey=None, edgeGroupKey=None, edgeGroups=[], showEdges=True, showEdgeLegend=False, colorScale="viridis"):
+    def DataByGraph(graph, vertexColor="black", vertexSize=6, vertexLabelKey=None, vertexGroupKey=None, vertexGroups=[], showVertices=True, showVertexLegend=False, edgeColor="black", edgeWidth=1, edgeLabelKey=None, edgeGroupKey=None, edgeGroups=[], showEdges=True, showEdgeLegend=False, colorScale="viridis", renderer="scatter3d"):
         """
         Creates plotly vertex and edge data from the input graph.
 
@@ -233,6 +398,8 @@ class Plotly:
             If set to True the edge legend will be drawn. Otherwise, it will not be drawn. The default is False.
         colorScale : str , optional
             The desired type of plotly color scales to use (e.g. "Viridis", "Plasma"). The default is "Viridis". For a full list of names, see https://plotly.com/python/builtin-colorscales/.
+        renderer : str , optional
+            The desired type of traces. This can be "scatter3d" or "webgl". If set to "webgl" and all the vertices of the graph lie at the same height, the graph is drawn with 2D WebGL (Scattergl) traces, which are much lighter than a 3D scene for large graphs. Otherwise, 3D traces are used. It is case insensitive. The default is "scatter3d".
         Returns
         -------
         list
@@ -241,57 +408,57 @@ class Plotly:
         """
         from topologicpy.Vertex import Vertex
         from topologicpy.Edge import Edge
-        from topologicpy.Dictionary import Dictionary
         from topologicpy.Topology import Topology
         from topologicpy.Graph import Graph
-        import plotly.graph_objs as go
 
         if not isinstance(graph, topologic.Graph):
             return None
+        # Local names avoid repeated global and attribute lookups in the loops below.
+        vX, vY, vZ = Vertex.X, Vertex.Y, Vertex.Z
+        use2D = False
+        if isinstance(renderer, str) and renderer.lower() == "webgl":
+            zs = np.round(np.fromiter((vZ(v) for v in Graph.Vertices(graph)), dtype=float), 4)
+            use2D = len(zs) == 0 or zs.min() == zs.max()
         v_labels = []
         v_groupList = []
         data = []
         if showVertices:
             vertices = Graph.Vertices(graph)
             if vertexLabelKey or vertexGroupKey:
-                for v in vertices:
-                    Xn=[round(Vertex.X(v),4) for v in vertices] # x-coordinates of nodes
-                    Yn=[round(Vertex.Y(v),4) for v in vertices] # y-coordinates of nodes
-                    Zn=[round(Vertex.Z(v),4) for v in vertices] # x-coordinates of nodes
+                # Gather coordinates, labels, and groups in a single pass over the vertices.
+                coords = []
+                v_groupIndex = _groupIndex(vertexGroups)
+                for v, d in zip(vertices, Topology.Dictionaries(vertices)):
+                    coords.extend((vX(v), vY(v), vZ(v)))
                     v_label = ""
                     v_group = ""
-                    d = Topology.Dictionary(v)
                     if d:
-                        try:
-                            v_label = str(Dictionary.ValueAtKey(d, key=vertexLabelKey)) or ""
-                        except:
-                            v_label = ""
-                        try:
-                            v_group = Dictionary.ValueAtKey(d, key=vertexGroupKey)
-                        except:
-                            v_group = None
+                        v_label = str(_valueAtKey(d, vertexLabelKey, ""))
+                        v_group = _valueAtKey(d, vertexGroupKey)
                     try:
-                        v_groupList.append(vertexGroups.index(v_group))
-                    except:
+                        v_groupList.append(v_groupIndex.get(v_group, len(vertexGroups)))
+                    except TypeError: # Unhashable group value
                         v_groupList.append(len(vertexGroups))
                     if not v_label == "" and not v_group == "":
                         if v_group == 0:
-                            v_label = v_label+" (0)"
+                            v_label = f"{v_label} (0)"
                         else:
-                            v_label = v_label+" ("+str(v_group)+")"
-                    v_labels.append(v_label)
+                            v_label = f"{v_label} ({v_group})"
+                    v_labels.append(intern(v_label))
             else:
-                for v in vertices:
-                    Xn=[round(Vertex.X(v),4) for v in vertices] # x-coordinates of nodes
-                    Yn=[round(Vertex.Y(v),4) for v in vertices] # y-coordinates of nodes
-                    Zn=[round(Vertex.Z(v),4) for v in vertices] # x-coordinates of nodes
-            if len(list(set(v_groupList))) < 2:
+                coords = chain.from_iterable((vX(v), vY(v), vZ(v)) for v in vertices)
+            # Contiguous float arrays, one per axis, serialize faster than lists of Python floats.
+            coords = np.fromiter(coords, dtype=float, count=3*len(vertices)).reshape(-1, 3)
+            np.round(coords, 4, out=coords)
+            Xn = np.ascontiguousarray(coords[:,0]) # x-coordinates of nodes
+            Yn = np.ascontiguousarray(coords[:,1]) # y-coordinates of nodes
+            Zn = np.ascontiguousarray(coords[:,2]) # z-coordinates of nodes
+            if _isUniform(v_groupList):
                 v_groupList = vertexColor
             if len(v_labels) < 1:
                 v_labels = ""
-            v_trace=go.Scatter3d(x=Xn,
+            v_args = dict(x=Xn,
                 y=Yn,
-                z=Zn,
                 mode='markers',
                 name='Graph Vertices',
                 legendgroup=4,
@@ -306,68 +473,96 @@ class Plotly:
                 text=v_labels,
                 hoverinfo='text'
                 )
+            if use2D:
+                v_trace = go.Scattergl(**v_args)
+            else:
+                v_trace = go.Scatter3d(z=Zn, **v_args)
             data.append(v_trace)
         
         if showEdges:
-            Xe=[]
-            Ye=[]
-            Ze=[]
             e_labels = []
             e_groupList = []
             edges = Graph.Edges(graph)
-                
+            startVertex, endVertex = Edge.StartVertex, Edge.EndVertex
+            svs = [startVertex(e) for e in edges]
+            evs = [endVertex(e) for e in edges]
+            # Interleave start, end, NaN so that each edge is drawn as a separate line segment.
+            e_coords = np.empty((3*len(edges), 3), dtype=float)
+            e_coords[0::3] = np.fromiter(chain.from_iterable((vX(v), vY(v), vZ(v)) for v in svs), dtype=float, count=3*len(svs)).reshape(-1, 3)
+            e_coords[1::3] = np.fromiter(chain.from_iterable((vX(v), vY(v), vZ(v)) for v in evs), dtype=float, count=3*len(evs)).reshape(-1, 3)
+            e_coords[2::3] = np.nan
+            np.round(e_coords, 4, out=e_coords)
+            Xe = np.ascontiguousarray(e_coords[:,0]) # x-coordinates of edge ends
+            Ye = np.ascontiguousarray(e_coords[:,1]) # y-coordinates of edge ends
+            Ze = np.ascontiguousarray(e_coords[:,2]) # z-coordinates of edge ends
+
             if edgeLabelKey or edgeGroupKey:
-                for e in edges:
-                    sv = Edge.StartVertex(e)
-                    ev = Edge.EndVertex(e)
-                    Xe+=[round(Vertex.X(sv),4), round(Vertex.X(ev),4), None] # x-coordinates of edge ends
-                    Ye+=[round(Vertex.Y(sv),4), round(Vertex.Y(ev),4), None] # y-coordinates of edge ends
-                    Ze+=[round(Vertex.Z(sv),4), round(Vertex.Z(ev),4), None] # z-coordinates of edge ends
+                e_groupIndex = _groupIndex(edgeGroups)
+                for d in Topology.Dictionaries(edges):
                     e_label = ""
                     e_group = ""
-                    d = Topology.Dictionary(e)
                     if d:
-                        try:
-                            e_label = str(Dictionary.ValueAtKey(d, key=edgeLabelKey)) or ""
-                        except:
-                            e_label = ""
-                        try:
-                            e_group = str(Dictionary.ValueAtKey(d, key=edgeGroupKey)) or ""
-                        except:
-                            e_group = ""
+                        e_label = str(_valueAtKey(d, edgeLabelKey, ""))
+                        e_group = str(_valueAtKey(d, edgeGroupKey, ""))
                     try:
-                        e_groupList.append(edgeGroups.index(e_group))
-                    except:
+                        e_groupList.append(e_groupIndex.get(e_group, len(edgeGroups)))
+                    except TypeError: # Unhashable group value
                         e_groupList.append(len(edgeGroups))
                     if not e_label == "" and not e_group == "":
-                        e_label = e_label+" ("+e_group+")"
-                    e_labels.append(e_label)
-            else:
-                for e in edges:
-                    sv = Edge.StartVertex(e)
-                    ev = Edge.EndVertex(e)
-                    Xe+=[round(Vertex.X(sv),4), round(Vertex.X(ev),4), None] # x-coordinates of edge ends
-                    Ye+=[round(Vertex.Y(sv),4), round(Vertex.Y(ev),4), None] # y-coordinates of edge ends
-                    Ze+=[round(Vertex.Z(sv),4), round(Vertex.Z(ev),4), None] # z-coordinates of edge ends
-
-            if len(list(set(e_groupList))) < 2:
+                        e_label = f"{e_label} ({e_group})"
+                    e_labels.append(intern(e_label))
+
+            if _isUniform(e_groupList):
                 e_groupList = edgeColor
             if len(e_labels) < 1:
                 e_labels = ""
             
-            e_trace=go.Scatter3d(x=Xe,
-                                 y=Ye,
-                                 z=Ze,
-                                 mode='lines',
-                                 name='Graph Edges',
-                                 legendgroup=5,
-                                 legendrank=5,
-                                 showlegend=showEdgeLegend,
-                                 line=dict(color=e_groupList, width=edgeWidth),
-                                 text=e_labels,
-                                 hoverinfo='text'
-                                )
-            data.append(e_trace)
+            if use2D and isinstance(e_groupList, list):
+                # Scattergl lines take a single color, so draw one trace per edge group.
+                e_groups = np.asarray(e_groupList)
+                minGroup = int(e_groups.min())
+                maxGroup = int(e_groups.max())
+                e_text = np.repeat(np.asarray(e_labels, dtype=object), 3) if isinstance(e_labels, list) else None
+                for n, g in enumerate(np.unique(e_groups).tolist()):
+                    mask = np.repeat(e_groups == g, 3)
+                    data.append(go.Scattergl(x=Xe[mask],
+                                             y=Ye[mask],
+                                             mode='lines',
+                                             name='Graph Edges',
+                                             legendgroup=5,
+                                             legendrank=5,
+                                             showlegend=(showEdgeLegend and n == 0),
+                                             line=dict(color=_rgbByValueInRange(g, minGroup, maxGroup, colorScale), width=edgeWidth),
+                                             text=e_text[mask] if e_text is not None else e_labels,
+                                             hoverinfo='text'
+                                            ))
+            elif use2D:
+                e_trace=go.Scattergl(x=Xe,
+                                     y=Ye,
+                                     mode='lines',
+                                     name='Graph Edges',
+                                     legendgroup=5,
+                                     legendrank=5,
+                                     showlegend=showEdgeLegend,
+                                     line=dict(color=e_groupList, width=edgeWidth),
+                                     text=e_labels,
+                                     hoverinfo='text'
+                                    )
+                data.append(e_trace)
+            else:
+                e_trace=go.Scatter3d(x=Xe,
+                                     y=Ye,
+                                     z=Ze,
+                                     mode='lines',
+                                     name='Graph Edges',
+                                     legendgroup=5,
+                                     legendrank=5,
+                                     showlegend=showEdgeLegend,
+                                     line=dict(color=e_groupList, width=edgeWidth),
+                                     text=e_labels,
+                                     hoverinfo='text'
+                                    )
+                data.append(e_trace)
 
         return data
 
@@ -388,7 +583,8 @@ class Plotly:
                        faceMinGroup=None, faceMaxGroup=None, 
                        showFaceLegend=False, faceLegendLabel="Topology Faces", faceLegendRank=3,
                        faceLegendGroup=3, 
-                       intensityKey=None, colorScale="Viridis", mantissa=4, tolerance=0.0001):
+                       intensityKey=None, colorScale="Viridis", mantissa=4, tolerance=0.0001,
+                       options=None):
         """
         Creates plotly face, edge, and vertex data.
 
@@ -497,6 +693,8 @@ class Plotly:
             The desired length of the mantissa. The default is 4.
         tolerance : float , optional
             The desired tolerance. The default is 0.0001.
+        options : DataByTopologyOptions , optional
+            If not None, the options created by Plotly.DataByTopologyOptions are used instead of the keyword arguments above. The default is None.
         
         Returns
         -------
@@ -504,69 +702,25 @@ class Plotly:
             The vertex, edge, and face data list.
 
         """
+        from topologicpy.Vertex import Vertex
+        from topologicpy.Edge import Edge
+        from topologicpy.Face import Face
         from topologicpy.Topology import Topology
-        from topologicpy.Dictionary import Dictionary
-        from topologicpy.Color import Color
+        def roundedXYZ(vertices):
+            # Rounds the (N, 3) coordinate array in one vectorized pass and returns its columns as contiguous arrays,
+            # which plotly serializes as typed arrays instead of lists of Python floats.
+            V = np.asarray(vertices, dtype=np.float64).reshape(-1, 3)
+            np.round(V, mantissa, out=V)
+            return np.ascontiguousarray(V[:,0]), np.ascontiguousarray(V[:,1]), np.ascontiguousarray(V[:,2])
+
         def vertexData(vertices, dictionaries=None, color="black", size=1.1, labelKey=None, groupKey=None, minGroup=None, maxGroup=None, groups=[], legendLabel="Topology Vertices", legendGroup=1, legendRank=1, showLegend=True, colorScale="Viridis"):
-            x = []
-            y = []
-            z = []
+            x, y, z = roundedXYZ(vertices)
             labels = []
             groupList = []
-            label = ""
-            group = ""
             if labelKey or groupKey:
-                if groups:
-                    if len(groups) > 0:
-                        if type(groups[0]) == int or type(groups[0]) == float:
-                            if not minGroup:
-                                minGroup = min(groups)
-                            if not maxGroup:
-                                maxGroup = max(groups)
-                        else:
-                            minGroup = 0
-                            maxGroup = len(groups) - 1
-                else:
-                    minGroup = 0
-                    maxGroup = 1
-                for m, v in enumerate(vertices):
-                    x.append(round(v[0], mantissa))
-                    y.append(round(v[1], mantissa))
-                    z.append(round(v[2], mantissa))
-                    label = ""
-                    group = ""
-                    if len(dictionaries) > 0:
-                        d = dictionaries[m]
-                        if d:
-                            try:
-                                label = str(Dictionary.ValueAtKey(d, key=labelKey)) or ""
-                            except:
-                                label = ""
-                            try:
-                                group = Dictionary.ValueAtKey(d, key=groupKey) or None
-                            except:
-                                group = ""
-                        try:
-                            if type(group) == int or type(group) == float:
-                                if group < minGroup:
-                                    group = minGroup
-                                if group > maxGroup:
-                                    group = maxGroup
-                                color = Color.ByValueInRange(group, minValue=minGroup, maxValue=maxGroup, colorScale=colorScale)
-                            else:
-                                color = Color.ByValueInRange(groups.index(group), minValue=minGroup, maxValue=maxGroup, colorScale=colorScale)
-                            color = "rgb("+str(color[0])+","+str(color[1])+","+str(color[2])+")"
-                            groupList.append(color)
-                        except:
-                            groupList.append(len(groups))
-                        labels.append(label)
-            else:
-                for v in vertices:
-                    x.append(round(v[0], mantissa))
-                    y.append(round(v[1], mantissa))
-                    z.append(round(v[2], mantissa))
+                labels, groupList, color = _groupColors(len(vertices), dictionaries, labelKey, groupKey, minGroup, maxGroup, groups, colorScale, color)
             
-            if len(list(set(groupList))) < 2:
+            if _isUniform(groupList):
                 groupList = color
             if len(labels) < 1:
                 labels = ""
@@ -585,70 +739,19 @@ class Plotly:
                                 )
 
         def edgeData(vertices, edges, dictionaries=None, color="black", width=1, labelKey=None, groupKey=None, minGroup=None, maxGroup=None, groups=[], legendLabel="Topology Edges", legendGroup=2, legendRank=2, showLegend=True, colorScale="Viridis"):
-            x = []
-            y = []
-            z = []
+            V = np.asarray(vertices, dtype=np.float64).reshape(-1, 3)
+            E = np.full((len(edges), 3, 3), np.nan) # Each edge contributes its start, its end, and a NaN line break.
+            E[:,:2,:] = V[np.asarray(edges, dtype=np.intp).reshape(-1, 2)]
+            np.round(E, mantissa, out=E)
+            E = E.reshape(-1, 3)
+            x, y, z = np.ascontiguousarray(E[:,0]), np.ascontiguousarray(E[:,1]), np.ascontiguousarray(E[:,2])
             labels = []
             groupList = []
-            label = ""
-            group = ""
             if labelKey or groupKey:
-                if groups:
-                    if len(groups) > 0:
-                        if type(groups[0]) == int or type(groups[0]) == float:
-                            if not minGroup:
-                                minGroup = min(groups)
-                            if not maxGroup:
-                                maxGroup = max(groups)
-                        else:
-                            minGroup = 0
-                            maxGroup = len(groups) - 1
-                else:
-                    minGroup = 0
-                    maxGroup = 1
-                for m, e in enumerate(edges):
-                    sv = vertices[e[0]]
-                    ev = vertices[e[1]]
-                    x+=[round(sv[0],5),round(ev[0],mantissa), None] # x-coordinates of edge ends
-                    y+=[round(sv[1],5),round(ev[1],mantissa), None] # y-coordinates of edge ends
-                    z+=[round(sv[2],5),round(ev[2],mantissa), None] # z-coordinates of edge ends
-                    label = ""
-                    group = ""
-                    if len(dictionaries) > 0:
-                        d = dictionaries[m]
-                        if d:
-                            try:
-                                label = str(Dictionary.ValueAtKey(d, key=labelKey)) or ""
-                            except:
-                                label = ""
-                            try:
-                                group = Dictionary.ValueAtKey(d, key=groupKey) or None
-                            except:
-                                group = ""
-                        try:
-                            if type(group) == int or type(group) == float:
-                                if group < minGroup:
-                                    group = minGroup
-                                if group > maxGroup:
-                                    group = maxGroup
-                                color = Color.ByValueInRange(group, minValue=minGroup, maxValue=maxGroup, colorScale=colorScale)
-                            else:
-                                color = Color.ByValueInRange(groups.index(group), minValue=minGroup, maxValue=maxGroup, colorScale=colorScale)
-                            color = "rgb("+str(color[0])+","+str(color[1])+","+str(color[2])+")"
-                            groupList.append(color)
-                        except:
-                            groupList.append(len(groups))
-                        labels.append(label)
-            else:
-                for e in edges:
-                    sv = vertices[e[0]]
-                    ev = vertices[e[1]]
-                    x+=[round(sv[0],mantissa),round(ev[0],mantissa), None] # x-coordinates of edge ends
-                    y+=[round(sv[1],mantissa),round(ev[1],mantissa), None] # y-coordinates of edge ends
-                    z+=[round(sv[2],mantissa),round(ev[2],mantissa), None] # z-coordinates of edge ends
+                labels, groupList, color = _groupColors(len(edges), dictionaries, labelKey, groupKey, minGroup, maxGroup, groups, colorScale, color)
                 
-            if len(list(set(groupList))) < 2:
-                    groupList = color
+            if _isUniform(groupList):
+                groupList = color
             if len(labels) < 1:
                 labels = ""
             return go.Scatter3d(x=x,
@@ -666,72 +769,16 @@ class Plotly:
 
 
         def faceData(vertices, faces, dictionaries=None, color="white", opacity=0.5, labelKey=None, groupKey=None, minGroup=None, maxGroup=None, groups=[], legendLabel="Topology Faces", legendGroup=3, legendRank=3, showLegend=True, intensities=None, colorScale="Viridis"):
-            x = []
-            y = []
-            z = []
-            for v in vertices:
-                x.append(round(v[0], mantissa))
-                y.append(round(v[1], mantissa))
-                z.append(round(v[2], mantissa))
-            i = []
-            j = []
-            k = []
+            x, y, z = roundedXYZ(vertices)
+            # Mesh3d takes the triangle indices as int32 arrays, without boxing them into lists of Python ints.
+            IJK = np.asarray(faces, dtype=np.int32).reshape(-1, 3)
+            i, j, k = np.ascontiguousarray(IJK[:,0]), np.ascontiguousarray(IJK[:,1]), np.ascontiguousarray(IJK[:,2])
             labels = []
             groupList = []
-            label = ""
-            group = ""
             if labelKey or groupKey:
-                if groups:
-                    if len(groups) > 0:
-                        if type(groups[0]) == int or type(groups[0]) == float:
-                            if not minGroup:
-                                minGroup = min(groups)
-                            if not maxGroup:
-                                maxGroup = max(groups)
-                        else:
-                            minGroup = 0
-                            maxGroup = len(groups) - 1
-                else:
-                    minGroup = 0
-                    maxGroup = 1
-                for m, f in enumerate(faces):
-                    i.append(f[0])
-                    j.append(f[1])
-                    k.append(f[2])
-                    label = ""
-                    group = ""
-                    if len(dictionaries) > 0:
-                        d = dictionaries[m]
-                        if d:
-                            try:
-                                label = str(Dictionary.ValueAtKey(d, key=labelKey)) or ""
-                            except:
-                                label = ""
-                            try:
-                                group = Dictionary.ValueAtKey(d, key=groupKey) or None
-                            except:
-                                group = ""
-                        try:
-                            if type(group) == int or type(group) == float:
-                                if group < minGroup:
-                                    group = minGroup
-                                if group > maxGroup:
-                                    group = maxGroup
-                                color = Color.ByValueInRange(group, minValue=minGroup, maxValue=maxGroup, colorScale=colorScale)
-                            else:
-                                color = Color.ByValueInRange(groups.index(group), minValue=minGroup, maxValue=maxGroup, colorScale=colorScale)
-                            color = "rgb("+str(color[0])+","+str(color[1])+","+str(color[2])+")"
-                            groupList.append(color)
-                        except:
-                            groupList.append(len(groups))
-                        labels.append(label)
-            else:
-                for f in faces:
-                    i.append(f[0])
-                    j.append(f[1])
-                    k.append(f[2])
+                labels, groupList, color = _groupColors(len(faces), dictionaries, labelKey, groupKey, minGroup, maxGroup, groups, colorScale, color)
                 
-            if len(list(set(groupList))) < 2:
+            if _isUniform(groupList):
                 groupList = None
             if len(labels) < 1:
                 labels = ""
@@ -760,82 +807,91 @@ class Plotly:
                 )
             return trace
         
-        from topologicpy.Cluster import Cluster
-        from topologicpy.Topology import Topology
-        from topologicpy.Dictionary import Dictionary
         if not isinstance(topology, topologic.Topology):
             return None
-        e_dictionaries = None
-        if edgeLabelKey or edgeGroupKey:
-            e_dictionaries = []
-            tp_edges = Topology.SubTopologies(topology, subTopologyType="edge")
-            for tp_edge in tp_edges:
-                e_dictionaries.append(Topology.Dictionary(tp_edge))
-            
-        f_dictionaries = None
-        if faceLabelKey or faceGroupKey:
-            f_dictionaries = []
-            tp_faces = Topology.SubTopologies(topology, subTopologyType="face")
-            for tp_face in tp_faces:
-                f_dictionaries.append(Topology.Dictionary(tp_face))
-        
+        if options is not None:
+            return Plotly.DataByTopology(topology, **options._asdict())
         data = []
         tp_verts = Topology.SubTopologies(topology, subTopologyType="vertex")
-        vertices = []
+        vertices = [[tp_v.X(), tp_v.Y(), tp_v.Z()] for tp_v in tp_verts]
+        # The vertex dictionaries are only fetched if a key needs them.
+        d_verts = []
+        if intensityKey or vertexLabelKey or vertexGroupKey:
+            d_verts = Topology.Dictionaries(tp_verts)
+        intensities = None
+        if intensityKey:
+            intensities = np.fromiter((_valueAtKey(d, intensityKey, 0) for d in d_verts), dtype=np.float64, count=len(d_verts))
         v_dictionaries = []
-        intensities = []
-        for i, tp_v in enumerate(tp_verts):
-            vertices.append([tp_v.X(), tp_v.Y(), tp_v.Z()])
-            d = Topology.Dictionary(tp_v)
-            if intensityKey:
-                if d:
-                    v = Dictionary.ValueAtKey(d, key=intensityKey)
-                    if not v == None:
-                        intensities.append(v)
-                    else:
-                        intensities.append(0)
-                else:
-                    intensities.append(0)
-            else:
-                intensities = None            
-            if vertexLabelKey or vertexGroupKey:
-                v_dictionaries.append(d)
+        if vertexLabelKey or vertexGroupKey:
+            v_dictionaries = d_verts
         #if intensities:
             #intensities = [float(m)/max(intensities) for m in intensities]
         if showVertices:
             data.append(vertexData(vertices, dictionaries=v_dictionaries, color=vertexColor, size=vertexSize, labelKey=vertexLabelKey, groupKey=vertexGroupKey, minGroup=vertexMinGroup, maxGroup=vertexMaxGroup, groups=vertexGroups, legendLabel=vertexLegendLabel, legendGroup=vertexLegendGroup, legendRank=vertexLegendRank, showLegend=showVertexLegend, colorScale=colorScale))
+        # Edge ends and triangle vertices are mapped to indices by their rounded coordinates, since the bindings return
+        # new wrappers for the same vertex. The linear Vertex.Index search is kept only for misses.
+        vertexLookup = {}
+        for n, v in enumerate(vertices):
+            vertexLookup.setdefault((round(v[0], 6), round(v[1], 6), round(v[2], 6)), n)
         if showEdges and topology.Type() > topologic.Vertex.Type():
             tp_edges = Topology.SubTopologies(topology, subTopologyType="edge")
+            e_dictionaries = None
+            if edgeLabelKey or edgeGroupKey:
+                e_dictionaries = Topology.Dictionaries(tp_edges)
             edges = []
             for tp_edge in tp_edges:
-                sv = Edge.StartVertex(tp_edge)
-                si = Vertex.Index(sv, tp_verts)
-                ev = Edge.EndVertex(tp_edge)
-                ei = Vertex.Index(ev, tp_verts)
-                edges.append([si, ei])
+                ends = []
+                for tp_v in (Edge.StartVertex(tp_edge), Edge.EndVertex(tp_edge)):
+                    n = vertexLookup.get((round(tp_v.X(), 6), round(tp_v.Y(), 6), round(tp_v.Z(), 6)))
+                    if n == None:
+                        n = Vertex.Index(tp_v, tp_verts)
+                    ends.append(n)
+                edges.append(ends)
             data.append(edgeData(vertices, edges, dictionaries=e_dictionaries, color=edgeColor, width=edgeWidth, labelKey=edgeLabelKey, groupKey=edgeGroupKey, minGroup=edgeMinGroup, maxGroup=edgeMaxGroup, groups=edgeGroups, legendLabel=edgeLegendLabel, legendGroup=edgeLegendGroup, legendRank=edgeLegendRank, showLegend=showEdgeLegend, colorScale=colorScale))
         if showFaces and topology.Type() >= topologic.Face.Type():
             tp_faces = Topology.SubTopologies(topology, subTopologyType="face")
             triangles = []
+            triangleFaces = [] # The index of the face of each triangle
+            triangleVertices = [] # The boundary vertices of each triangle, if already known
+            for n, tp_face in enumerate(tp_faces):
+                # A face with exactly three vertices is a triangle without holes, since a hole would add vertices.
+                wv = Topology.SubTopologies(tp_face, subTopologyType="vertex")
+                if len(wv) == 3:
+                    # Already a triangle. Skip the triangulation and keep its vertices for the index lookup below.
+                    triangles.append(tp_face)
+                    triangleFaces.append(n)
+                    triangleVertices.append(wv)
+                else:
+                    temp_faces = Face.Triangulate(tp_face)
+                    triangles += temp_faces
+                    triangleFaces += [n]*len(temp_faces)
+                    triangleVertices += [None]*len(temp_faces)
             f_dictionaries = []
-            for tp_face in tp_faces:
-                temp_faces = Face.Triangulate(tp_face)
-                for tri in temp_faces:
-                    triangles.append(tri)
-                    if faceLabelKey or faceGroupKey:
-                        f_dictionaries.append(Topology.Dictionary(tp_face))
+            if faceLabelKey or faceGroupKey:
+                # Each face dictionary is fetched once and shared by the triangles of that face.
+                d_faces = Topology.Dictionaries(tp_faces)
+                f_dictionaries = [d_faces[n] for n in triangleFaces]
             faces = []
             orig_tolerance = tolerance
-            for tri in triangles:
-                w = Face.ExternalBoundary(tri)
-                w_vertices = Topology.SubTopologies(w, subTopologyType="vertex")
+            vertexArray = np.asarray(vertices, dtype=np.float64).reshape(-1, 3)
+            for tri, w_vertices in zip(triangles, triangleVertices):
+                if w_vertices == None:
+                    # The vertices of a triangle are those of its external boundary, so there is no need to fetch the wire.
+                    w_vertices = Topology.SubTopologies(tri, subTopologyType="vertex")
                 temp_f = []
                 for w_v in w_vertices:
-                    i = None
-                    tolerance = orig_tolerance
-                    while i == None and tolerance < 3:
-                        i = Vertex.Index(vertex=w_v, vertices=tp_verts, tolerance=tolerance)
-                        tolerance = tolerance*10
+                    xyz = (w_v.X(), w_v.Y(), w_v.Z())
+                    i = vertexLookup.get((round(xyz[0], 6), round(xyz[1], 6), round(xyz[2], 6)))
+                    if i == None and len(vertexArray) > 0:
+                        # Same result as retrying Vertex.Index at growing tolerances, but the distances to all the
+                        # vertices are computed once, in NumPy, and rounded like Vertex.Distance.
+                        distances = np.round(np.sqrt(((vertexArray - xyz)**2).sum(axis=1)), 4)
+                        tolerance = orig_tolerance
+                        while i == None and tolerance < 3:
+                            hits = np.flatnonzero(distances < tolerance)
+                            if len(hits) > 0:
+                                i = int(hits[0])
+                            tolerance = tolerance*10
                     if not i == None:
                         temp_f.append(i)
                 if len(temp_f) > 2:
@@ -844,6 +900,28 @@ class Plotly:
         return data
 
 
+    @staticmethod
+    def DataByTopologyOptions(**kwargs):
+        """
+        Returns an immutable set of options for Plotly.DataByTopology. Create it once and pass it as the options input of Plotly.DataByTopology to reuse the same settings across calls. Use options._replace(faceColor="red") to derive a modified copy.
+
+        Parameters
+        ----------
+        **kwargs
+            Any of the keyword arguments of Plotly.DataByTopology except topology and options. Omitted arguments take the defaults of Plotly.DataByTopology.
+
+        Returns
+        -------
+        DataByTopologyOptions
+            The created options.
+
+        """
+        try:
+            return _DataByTopologyOptions(**kwargs)
+        except TypeError:
+            print("Plotly.DataByTopologyOptions - Error: The input keyword arguments are not valid options of Plotly.DataByTopology. Returning None.")
+            return None
+
     @staticmethod
     def FigureByConfusionMatrix(matrix,
              categories=[],
@@ -965,9 +1043,9 @@ class Plotly:
         categories : list
             The list of categories to use on the X and Y axes.
         minValue : float , optional
-            The desired minimum value to use for the color scale. If set to None, the minmum value found in the input matrix will be used. The default is None.
+            The desired minimum value to use for the color scale. The heatmap shows each row normalized by its sum, so this value is on that normalized scale. If set to None, the minimum of the normalized values is used. The default is None.
         maxValue : float , optional
-            The desired maximum value to use for the color scale. If set to None, the maximum value found in the input matrix will be used. The default is None.
+            The desired maximum value to use for the color scale. The heatmap shows each row normalized by its sum, so this value is on that normalized scale. If set to None, the maximum of the normalized values is used. The default is None.
         title : str , optional
             The desired title to display. The default is "Confusion Matrix".
         xTitle : str , optional
@@ -1005,7 +1083,6 @@ class Plotly:
 
         """
         #import plotly.figure_factory as ff
-        import plotly.graph_objects as go
         import plotly.express as px
 
         if not isinstance(matrix, list) and not isinstance(matrix, np.ndarray):
@@ -1022,60 +1099,30 @@ class Plotly:
             xCategories = [x for x in range(len(matrix[0]))]
         if not yCategories:
             yCategories = [y for y in range(len(matrix))]
+        texts = np.round(matrix, mantissa).astype(str).tolist() # The annotation text of every cell in one pass
         
-        if not maxValue or not minValue:
-            max_values = []
-            min_values = []
-            for i in range(len(matrix)):
-                row = matrix[i]
-                max_values.append(max(row))
-                min_values.append(min(row))
-                for j, value in enumerate(row):
-                    annotations.append(
-                        {
-                            "x": xCategories[j],
-                            "y": yCategories[i],
-                            "font": {"color": "black"},
-                            "bgcolor": "white",
-                            "opacity": 0.5,
-                            "text": str(round(value, mantissa)), 
-                            "xref": "x1",
-                            "yref": "y1",
-                            "showarrow": False
-                        }
-                    )
-            if not minValue:
-                minValueB = min(min_values)
-            if not maxValue:
-                maxValue = max(max_values)
-        else:
-            for i in range(len(matrix)):
-                row = matrix[i]
-                for j, value in enumerate(row):
-                    annotations.append(
-                        {
-                            "x": xCategories[j],
-                            "y": yCategories[i],
-                            "font": {"color": "black"},
-                            "bgcolor": "white",
-                            "opacity": 0.5,
-                            "text": str(round(value,mantissa)),
-                            "xref": "x1",
-                            "yref": "y1",
-                            "showarrow": False
-                        }
-                    )
-        new_matrix = []
-        for i in range(len(matrix)):
-            row = matrix[i]
-            new_row = []
-            maxRow = sum(row)
-            for j in range(len(row)):
-                if maxRow == 0:
-                    new_row.append(round(0, mantissa))
-                else:
-                    new_row.append(round(float(row[j])/float(maxRow), mantissa))
-            new_matrix.append(new_row)
+        # Only the position and text change from cell to cell, so each annotation is a shallow copy of one template.
+        # The nested font dict is shared, which is safe because it is only read.
+        template = {
+            "font": {"color": "black"},
+            "bgcolor": "white",
+            "opacity": 0.5,
+            "xref": "x1",
+            "yref": "y1",
+            "showarrow": False
+        }
+        for i, row in enumerate(texts):
+            y = yCategories[i]
+            for j, text in enumerate(row):
+                annotation = template.copy()
+                annotation["x"] = xCategories[j]
+                annotation["y"] = y
+                annotation["text"] = text
+                annotations.append(annotation)
+        # Normalize each row by its sum. Rows that sum to zero stay zero.
+        sums = matrix.sum(axis=1, keepdims=True).astype(np.float64)
+        new_matrix = np.divide(matrix, sums, out=np.zeros(matrix.shape), where=sums != 0)
+        new_matrix = np.round(new_matrix, mantissa).tolist()
         data = go.Heatmap(z=new_matrix, y=yCategories, x=xCategories, zmin=minValue, zmax=maxValue, showscale=showScale, colorscale=colors)
         
         layout = {
@@ -1239,50 +1286,35 @@ class Plotly:
             The created plotly figure.
 
         """
-        from topologicpy.Vertex import Vertex
-        from topologicpy.Edge import Edge
-        from topologicpy.Wire import Wire
         if not isinstance(data, list):
             return None
 
-        v0 = Vertex.ByCoordinates(0,0,0)
-        v1 = Vertex.ByCoordinates(axisSize,0,0)
-        v2 = Vertex.ByCoordinates(0,axisSize,0)
-        v3 = Vertex.ByCoordinates(0,0,axisSize)
-
-        if xAxis:
-            xEdge = Edge.ByVertices([v0,v1])
-            xWire = Wire.ByEdges([xEdge])
-            xData = Plotly.DataByTopology(xWire, edgeColor="red", edgeWidth=6, showFaces=False, showEdges=True, showVertices=False, edgeLegendLabel="X-Axis")
-            data = data + xData
-        if yAxis:
-            yEdge = Edge.ByVertices([v0,v2])
-            yWire = Wire.ByEdges([yEdge])
-            yData = Plotly.DataByTopology(yWire, edgeColor="green", edgeWidth=6, showFaces=False, showEdges=True, showVertices=False, edgeLegendLabel="Y-Axis")
-            data = data + yData
-        if zAxis:
-            zEdge = Edge.ByVertices([v0,v3])
-            zWire = Wire.ByEdges([zEdge])
-            zData = Plotly.DataByTopology(zWire, edgeColor="blue", edgeWidth=6, showFaces=False, showEdges=True, showVertices=False, edgeLegendLabel="Z-Axis")
-            data = data + zData
-
-        figure = go.Figure(data=data)
-        figure.update_layout(
+        # The requested axes are drawn as one line trace, with a None break between axes and one color per point.
+        xs, ys, zs, colors = [], [], [], []
+        for drawAxis, end, color in ((xAxis, (axisSize,0,0), "red"), (yAxis, (0,axisSize,0), "green"), (zAxis, (0,0,axisSize), "blue")):
+            if drawAxis:
+                xs += [0, end[0], None]
+                ys += [0, end[1], None]
+                zs += [0, end[2], None]
+                colors += [color]*3
+        if len(xs) > 0:
+            # A single concatenation. The input list belongs to the caller, so it is not extended in place.
+            data = data + [go.Scatter3d(x=xs, y=ys, z=zs, mode="lines", line=dict(color=colors, width=6), name="Axes", showlegend=False, hoverinfo="skip")]
+
+        # The whole layout, including the hidden 2D axes, is passed to the constructor so that it is validated once
+        # instead of once more for each update call.
+        layout = dict(
             width=width,
             height=height,
             showlegend=True,
-            scene = dict(
-                xaxis = dict(visible=False),
-                yaxis = dict(visible=False),
-                zaxis =dict(visible=False),
-                ),
-            scene_aspectmode='data',
+            scene=_HIDDEN_SCENE,
+            xaxis=_HIDDEN_AXIS,
+            yaxis=_HIDDEN_AXIS,
             paper_bgcolor=backgroundColor,
             plot_bgcolor=backgroundColor,
             margin=dict(l=marginLeft, r=marginRight, t=marginTop, b=marginBottom),
             )
-        figure.update_xaxes(showgrid=False, zeroline=False, visible=False)
-        figure.update_yaxes(showgrid=False, zeroline=False, visible=False)
+        figure = go.Figure(data=data, layout=layout)
         return figure
 
     @staticmethod
@@ -1304,7 +1336,7 @@ class Plotly:
         figure = None
         if not file:
             return None
-        figure = plotly.io.read_json(file, output_type='Figure', skip_invalid=True, engine=None)
+        figure = _figureByJSON(file.read())
         file.close()
         return figure
     
@@ -1326,12 +1358,18 @@ class Plotly:
         """
         if not path:
             return None
-        try:
-            file = open(path)
-        except:
+        # Check for the file up front, so that the common missing-file case does not raise.
+        stat = None
+        if os.path.isfile(path):
+            try:
+                stat = os.stat(path)
+            except OSError:
+                stat = None
+        if stat == None:
             print("Plotly.FigureByJSONPath - Error: the JSON file is not a valid file. Returning None.")
             return None
-        return Plotly.FigureByJSONFile(file)
+        # The parsed figure is cached until the file changes. Return a copy so that the caller can modify it freely.
+        return go.Figure(_figureByJSONPath(os.path.abspath(path), stat.st_mtime_ns, stat.st_size))
 
     @staticmethod
     def FigureByPieChart(data, values, names):
@@ -1341,17 +1379,20 @@ class Plotly:
         Parameters
         ----------
         data : list
-            The input list of plotly data.
+            Not used. The pie chart is built from the values and names inputs. This input is kept for backward compatibility.
         values : list
             The input list of values.
         names : list
             The input list of names.
+
+        Returns
+        -------
+        plotly.graph_objs._figure.Figure
+            The created plotly figure.
+
         """
-        import pandas as pd
         import plotly.express as px
-        dlist = list(map(list, zip(*data)))
-        df = pd.DataFrame(dlist, columns=data['names'])
-        fig = px.pie(df, values=values, names=names)
+        fig = px.pie(values=values, names=names)
         return fig
     
     @staticmethod
@@ -1573,6 +1614,69 @@ class Plotly:
             figure = Plotly.AddColorBar(figure, values=cbValues, nTicks=cbTicks, xPosition=cbX, width=cbWidth, outlineWidth=cbOutlineWidth, title=cbTitle, subTitle=cbSubTitle, units=cbUnits, colorScale=colorScale, mantissa=mantissa)
         return figure
     
+    @staticmethod
+    def FigureExportBatch(figure, targets, width=1920, height=1200, overwrite=False):
+        """
+        Exports the input plotly figure to several image files at once. The figure is converted once and the images are rendered by one shared Kaleido process, so only the file writes of the exports overlap. If that shared Kaleido process is not available, the exports are run one after the other.
+
+        Parameters
+        ----------
+        figure : plotly.graph_objs._figure.Figure
+            The input plotly figure.
+        targets : list
+            The list of [path, format] pairs to export. The format can be any of "jpg", "jpeg", "pdf", "png", "svg", or "webp". It is case insensitive. The extension is added to the path if it is missing.
+        width : int, optional
+            The width of the exported images in pixels. The default is 1920.
+        height : int , optional
+            The height of the exported images in pixels. The default is 1200.
+        overwrite : bool , optional
+            If set to True the ouptut files will overwrite any pre-existing files. Otherwise, they won't.
+
+        Returns
+        -------
+        list
+            The list of export results, in the order of the targets. Each is True if that export operation is successful. False otherwise.
+
+        """
+        from concurrent.futures import ThreadPoolExecutor
+        if not isinstance(figure, plotly.graph_objs._figure.Figure):
+            print("Plotly.FigureExportBatch - Error: The input figure is not a plolty figure. Returning None.")
+            return None
+        if not isinstance(targets, list):
+            print("Plotly.FigureExportBatch - Error: The input targets is not a list. Returning None.")
+            return None
+
+        def export(target):
+            try:
+                path, format = target
+                format = format.lower()
+            except Exception:
+                print("Plotly.FigureExportBatch - Error: The target "+str(target)+" is not a valid [path, format] pair. Skipping.")
+                return False
+            if not isinstance(path, str) or not format in ["jpg", "jpeg", "pdf", "png", "svg", "webp"]:
+                print("Plotly.FigureExportBatch - Error: The target "+str(target)+" is not a valid [path, format] pair. Skipping.")
+                return False
+            if not path.lower().endswith("."+format):
+                path = path+"."+format
+            if overwrite == False and os.path.exists(path):
+                print("Plotly.FigureExportBatch - Error: A file already exists at "+path+" and overwrite is set to False. Skipping.")
+                return False
+            try:
+                _writeImage(figure, path, format, width, height, figureDict=figureDict)
+            except Exception as e:
+                print("Plotly.FigureExportBatch - Error: Could not export the figure to "+path+" ("+str(e)+"). Skipping.")
+                return False
+            return True
+
+        if len(targets) == 0:
+            return []
+        figureDict = figure.to_dict() # Converted and validated once for all the targets
+        if not _getKaleidoScope():
+            # Without the shared legacy Kaleido scope, each export starts its own renderer, so they are run one at a time.
+            return [export(target) for target in targets]
+        with ThreadPoolExecutor(max_workers=min(len(targets), os.cpu_count() or 4)) as executor:
+            return list(executor.map(export, targets))
+
     @staticmethod
     def FigureExportToJSON(figure, path, overwrite=False):
         """
@@ -1600,20 +1704,19 @@ class Plotly:
             print("Plotly.FigureExportToJSON - Error: The input path is not a string. Returning None.")
             return None
         # Make sure the file extension is .json
-        ext = path[len(path)-5:len(path)]
-        if ext.lower() != ".json":
+        if not path.lower().endswith(".json"):
             path = path+".json"
         f = None
         try:
             if overwrite == True:
-                f = open(path, "w")
+                f = open(path, "wb")
             else:
-                f = open(path, "x") # Try to create a new File
-        except:
+                f = open(path, "xb") # Try to create a new File
+        except OSError:
            print("Plotly.FigureExportToJSON - Error: Could not create a new file at the following location: "+path+". Returning None.")
            return None
         if (f):
-            plotly.io.write_json(figure, f, validate=True, pretty=False, remove_uids=True, engine=None)
+            f.write(_figureJSON(figure))
             f.close()    
             return True
         if f:
@@ -1647,7 +1750,6 @@ class Plotly:
             True if the export operation is successful. False otherwise.
 
         """
-        import os
         if not isinstance(figure, plotly.graph_objs._figure.Figure):
             print("Plotly.FigureExportToPNG - Error: The input figure is not a plolty figure. Returning None.")
             return None
@@ -1655,15 +1757,14 @@ class Plotly:
             print("Plotly.FigureExportToPNG - Error: The input path is not a string. Returning None.")
             return None
         # Make sure the file extension is .pdf
-        ext = path[len(path)-4:len(path)]
-        if ext.lower() != ".pdf":
+        if not path.lower().endswith(".pdf"):
             path = path+".pdf"
         
         if overwrite == False and os.path.exists(path):
             print("Plotly.FigureExportToPDF - Error: A file already exists at this location and overwrite is set to False. Returning None.")
             return None
 
-        plotly.io.write_image(figure, path, format='pdf', scale=1, width=width, height=height, validate=True, engine='auto')  
+        _writeImage(figure, path, 'pdf', width, height)
         return True
     
     @staticmethod
@@ -1690,7 +1791,6 @@ class Plotly:
             True if the export operation is successful. False otherwise.
 
         """
-        import os
         if not isinstance(figure, plotly.graph_objs._figure.Figure):
             print("Plotly.FigureExportToPNG - Error: The input figure is not a plolty figure. Returning None.")
             return None
@@ -1698,15 +1798,14 @@ class Plotly:
             print("Plotly.FigureExportToPNG - Error: The input path is not a string. Returning None.")
             return None
         # Make sure the file extension is .png
-        ext = path[len(path)-4:len(path)]
-        if ext.lower() != ".png":
+        if not path.lower().endswith(".png"):
             path = path+".png"
         
         if overwrite == False and os.path.exists(path):
             print("Plotly.FigureExportToPNG - Error: A file already exists at this location and overwrite is set to False. Returning None.")
             return None
 
-        plotly.io.write_image(figure, path, format='png', scale=1, width=width, height=height, validate=True, engine='auto')  
+        _writeImage(figure, path, 'png', width, height)
         return True
     
     @staticmethod
@@ -1733,7 +1832,6 @@ class Plotly:
             True if the export operation is successful. False otherwise.
 
         """
-        import os
         if not isinstance(figure, plotly.graph_objs._figure.Figure):
             print("Plotly.FigureExportToSVG - Error: The input figure is not a plolty figure. Returning None.")
             return None
@@ -1741,17 +1839,34 @@ class Plotly:
             print("Plotly.FigureExportToSVG - Error: The input path is not a string. Returning None.")
             return None
         # Make sure the file extension is .svg
-        ext = path[len(path)-4:len(path)]
-        if ext.lower() != ".svg":
+        if not path.lower().endswith(".svg"):
             path = path+".svg"
         
         if overwrite == False and os.path.exists(path):
             print("Plotly.FigureExportToSVG - Error: A file already exists at this location and overwrite is set to False. Returning None.")
             return None
 
-        plotly.io.write_image(figure, path, format='svg', scale=1, width=width, height=height, validate=True, engine='auto')  
+        _writeImage(figure, path, 'svg', width, height)
         return True
     
+    @staticmethod
+    def IsColor(color):
+        """
+        Returns True if the input color is a named CSS color that plotly can use. Returns False otherwise. See Plotly.Colors.
+
+        Parameters
+        ----------
+        color : str
+            The input color name.
+
+        Returns
+        -------
+        bool
+            True if the input color is a named CSS color. False otherwise.
+
+        """
+        return isinstance(color, str) and color.lower() in _COLORS_SET
+
     @staticmethod
     def SetCamera(figure, camera=[1.25, 1.25, 1.25], target=[0, 0, 0], up=[0, 0, 1]):
         """
@@ -1785,7 +1900,9 @@ class Plotly:
         eye=dict(x=camera[0], y=camera[1], z=camera[2]),
         center=dict(x=target[0], y=target[1], z=target[2])
         )
-        figure.update_layout(scene_camera=scene_camera)
+        # Update the camera object itself rather than going through update_layout, which parses the whole layout update.
+        # Like update_layout, this merges, so any other camera settings (e.g. the projection) are kept.
+        figure.layout.scene.camera.update(scene_camera)
         return figure
 
     @staticmethod
@@ -1817,7 +1934,7 @@ class Plotly:
         if not isinstance(figure, plotly.graph_objs._figure.Figure):
             print("Plotly.Show - Error: The input is not a figure. Returning None.")
             return None
-        if not renderer.lower() in Plotly.Renderers():
+        if not renderer.lower() in _RENDERERS_SET:
             print("Plotly.Show - Error: The input renderer is not in the approved list of renderers. Returning None.")
             return None
         if not camera == None:
@@ -1843,11 +1960,7 @@ class Plotly:
             The list of the available plotly renderers.
 
         """
-        return ['plotly_mimetype', 'jupyterlab', 'nteract', 'vscode',
-         'notebook', 'notebook_connected', 'kaggle', 'azure', 'colab',
-         'cocalc', 'databricks', 'json', 'png', 'jpeg', 'jpg', 'svg',
-         'pdf', 'browser', 'firefox', 'chrome', 'chromium', 'iframe',
-         'iframe_connected', 'sphinx_gallery', 'sphinx_gallery_png', 'offline']
+        return list(_RENDERERS)
 
     @staticmethod
     def ExportToImage(figure, path, format="png", width="1920", height="1080"):
@@ -1881,9 +1994,14 @@ class Plotly:
             return None
         returnStatus = False
         try:
-            plotly.io.write_image(figure, path, format=format.lower(), scale=None, width=width, height=height, validate=True, engine='auto')
+            _writeImage(figure, path, format.lower(), width, height, scale=None)
             returnStatus = True
         except:
             returnStatus = False
         return returnStatus
 
+# The options of Plotly.DataByTopology, taken from its signature (less topology and options) so that the two stay in sync.
+_dataByTopologyParameters = list(inspect.signature(Plotly.DataByTopology).parameters.values())[1:-1]
+_DataByTopologyOptions = namedtuple("DataByTopologyOptions",
+                                    [p.name for p in _dataByTopologyParameters],
+                                    defaults=[p.default for p in _dataByTopologyParameters])
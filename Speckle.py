@@ -6,51 +6,124 @@ from specklepy.objects.other import RenderMaterial
 from specklepy.transports.server import ServerTransport
 from topologicpy.Topology import Topology
 from specklepy.objects.geometry import (Mesh, Point, Polyline)
+import numpy as np
+from functools import lru_cache
+import logging
+
+log = logging.getLogger(__name__)
+
+# Authenticated clients and server transports are reused across calls, so the handshake and connection setup are paid once.
+@lru_cache(maxsize=8)
+def _clientByURL(url, token, use_ssl=True):
+    client = SpeckleClient(host=url, use_ssl=use_ssl)
+    client.authenticate_with_token(token)
+    return client
+
+# Bounded like the client cache, so clients passed in by callers are not kept alive for the life of the process.
+@lru_cache(maxsize=8)
+def _transportByStream(client, stream_id):
+    return ServerTransport(client=client, stream_id=stream_id)
+
+def _byID(collection, id):
+    # A dictionary of items by id is looked up directly. Anything else is scanned.
+    if isinstance(collection, dict):
+        return collection.get(id)
+    return next((x for x in collection if x.id == id), None)
+
+_sendExecutor = None
+
+def _getSendExecutor():
+    # Background sends run one at a time. Each one uses its own ServerTransport, so it never shares an HTTP session with calls on the caller's thread.
+    global _sendExecutor
+    if _sendExecutor is None:
+        from concurrent.futures import ThreadPoolExecutor
+        _sendExecutor = ThreadPoolExecutor(max_workers=1)
+    return _sendExecutor
+
+# One render material per opacity, shared by reference by every mesh that uses it. Callers must not modify it.
+@lru_cache(maxsize=None)
+def _renderMaterial(opacity):
+    material = RenderMaterial()
+    material['Opacity'] = opacity
+    return material
+
+def _mesh_to_speckle_impl(topology):
+    geom = Topology.Geometry(topology)
+    vertices = geom['vertices']
+    faces = geom['faces']
+    if len(vertices) == 0:
+        speckle_mesh = Mesh(vertices=[], faces=[])
+        speckle_mesh["renderMaterial"] = _renderMaterial(0.5)
+        return speckle_mesh
+    # Flatten the [x, y, z] vertices into Speckle's flat coordinate list in one NumPy pass.
+    m_verts: List[float] = np.ascontiguousarray(vertices, dtype=np.float64).reshape(-1).tolist()
+    # Each face is written as its vertex count followed by its vertex indices, into a list sized up front.
+    sizes = [len(f) for f in faces]
+    if len(sizes) > 0 and min(sizes) == max(sizes):
+        # All the faces have the same number of vertices (e.g. all triangles), so write the count column and the indices into one array.
+        F = np.empty((len(faces), sizes[0]+1), dtype=np.int64)
+        F[:,0] = sizes[0]
+        F[:,1:] = faces
+        m_faces: List[int] = F.reshape(-1).tolist()
+    else:
+        m_faces: List[int] = [0]*(sum(sizes) + len(faces))
+        i = 0
+        for f, n in zip(faces, sizes):
+            m_faces[i] = n
+            m_faces[i+1:i+1+n] = f
+            i += n+1
+
+    speckle_mesh = Mesh(
+        vertices=m_verts,
+        faces=m_faces,
+    )      
+    speckle_mesh["renderMaterial"] = _renderMaterial(0.5)
+    return speckle_mesh
+
 class Speckle:
 
     @staticmethod
     def mesh_to_speckle(topology) -> Base:
+        """
+        Parameters
+        ----------
+        topology : topologic.Topology
+            The input topology.
+
+        Returns
+        -------
+        Base
+            A Speckle object holding the converted mesh as its display value. See Speckle.mesh_to_speckle_mesh.
+
+        """
         b = Base()
         b["name"] = "Topologic_Object"
-        b["@displayValue"] = Speckle.mesh_to_speckle_mesh(topology)
+        b["@displayValue"] = _mesh_to_speckle_impl(topology)
         return b
 
     @staticmethod
     def mesh_to_speckle_mesh(topology) -> Mesh:
+        """
+        Parameters
+        ----------
+        topology : topologic.Topology
+            The input topology.
 
-        geom = Topology.Geometry(topology)
-        vertices = geom['vertices']
-        faces = geom['faces']
-        m_verts: List[float] = []
-        m_faces: List[int] = []
+        Returns
+        -------
+        Mesh
+            The converted Speckle mesh. Its render material is shared by every converted mesh and must be treated as read-only. To change the material of one mesh, assign it a new RenderMaterial instead of editing the existing one.
 
-        for v in vertices:
-            m_verts.append(v[0])
-            m_verts.append(v[1])
-            m_verts.append(v[2])
-        
-        for f in faces:
-            n = len(f)
-            m_faces.append(n)
-            for i in range(n):
-                m_faces.append(f[i])
-
-        speckle_mesh = Mesh(
-            vertices=m_verts,
-            faces=m_faces,
-        )      
-        speckle_mat = RenderMaterial()
-        speckle_mat['Opacity'] = 0.5
-        speckle_mesh["renderMaterial"] = speckle_mat
-        return speckle_mesh
+        """
+        return _mesh_to_speckle_impl(topology)
 
     @staticmethod
     def SpeckleBranchByID(branch_list, branch_id):
         """
         Parameters
         ----------
-        branch_list : TYPE
-            DESCRIPTION.
+        branch_list : list or dict
+            The list of branches. For repeated lookups, pass a dictionary of branches by id instead, e.g. {x.id: x for x in branch_list}.
         branch_id : TYPE
             DESCRIPTION.
 
@@ -61,10 +134,7 @@ class Speckle:
 
         """
         # branch_list, branch_id = item
-        for branch in branch_list:
-            if branch.id == branch_id:
-                return branch
-        return None
+        return _byID(branch_list, branch_id)
 
     @staticmethod
     def BranchesByStream(client, stream):
@@ -84,10 +154,8 @@ class Speckle:
         """
         # client, stream = item
         bList = client.branch.list(stream.id)
-        branches = []
-        for b in bList:
-            branches.append(client.branch.get(stream.id, b.name))
-        return branches
+        # The fetches stay sequential: the client's GraphQL transport connects and closes on every call and cannot be shared between threads.
+        return [client.branch.get(stream.id, b.name) for b in bList]
     
     @staticmethod
     def ClientByURL(url="speckle.xyz", token=None):
@@ -111,17 +179,15 @@ class Speckle:
         if token == None:
             print("Speckle.ClientByHost - Error: Could not retrieve token. Returning None.")
             return None
-        client = SpeckleClient(host=url) # or whatever your host is
-        client.authenticate_with_token(token)
-        return client
+        return _clientByURL(url, token)
     
     @staticmethod
     def CommitByID(commit_list, commit_id):
         """
         Parameters
         ----------
-        commit_list : TYPE
-            DESCRIPTION.
+        commit_list : list or dict
+            The list of commits. For repeated lookups, pass a dictionary of commits by id instead, e.g. {x.id: x for x in commit_list}.
         commit_id : TYPE
             DESCRIPTION.
 
@@ -132,10 +198,7 @@ class Speckle:
 
         """
         # commit_list, commit_id = item
-        for commit in commit_list:
-            if commit.id == commit_id:
-                return commit
-        return None
+        return _byID(commit_list, commit_id)
     
     @staticmethod
     def SpeckleCommitByURL(url, token):
@@ -155,35 +218,20 @@ class Speckle:
         """
         # url, token = item
         
-        def streamByID(item):
-            stream_list, stream_id = item
-            for stream in stream_list:
-                if stream.id == stream_id:
-                    return stream
-            return None
-
         def streamsByClient(client):
             return client.stream.list()
         
-        def commitByID(item):
-            commit_list, commit_id = item
-            for commit in commit_list:
-                if commit.id == commit_id:
-                    return commit
-            return None
-        
         # provide any stream, branch, commit, object, or globals url
         wrapper = StreamWrapper(url)
-        client = wrapper.get_client()
-        client.authenticate_with_token(token)
-        print("Client", client)
+        client = _clientByURL(wrapper.host, token, wrapper.use_ssl) if token else wrapper.get_client()
+        log.debug("Client %s", client)
         streams = streamsByClient(client)
-        print("Streams", streams)
-        stream = streamByID([streams, wrapper.stream_id])
-        print("Stream", stream)
+        log.debug("Streams %s", streams)
+        stream = _byID(streams, wrapper.stream_id)
+        log.debug("Stream %s", stream)
         commits = client.commit.list(wrapper.stream_id)
-        commit = commitByID([commits, wrapper.commit_id])
-        print(commit)
+        commit = _byID(commits, wrapper.commit_id)
+        log.debug("Commit %s", commit)
         return commit
     
     @staticmethod
@@ -249,18 +297,25 @@ class Speckle:
         """
         # client, stream = item
         
-        def processBase(base):
+        def processBase(root):
+            # Walk the nested Base objects with a stack instead of recursing, so deep trees cannot hit the recursion limit.
+            plainTypes = (float, int, str, list)
             dictionary = {}
-            dynamic_member_names = base.get_dynamic_member_names()
-            for dynamic_member_name in dynamic_member_names:
-                attribute = base[dynamic_member_name]
-                if isinstance(attribute, float) or isinstance(attribute, int) or isinstance(attribute, str) or isinstance(attribute, list):
-                    dictionary[dynamic_member_name] = attribute
-                if isinstance(attribute, Base):
-                    dictionary[dynamic_member_name] = processBase(attribute)
+            stack = [(root, dictionary)]
+            while stack:
+                base, target = stack.pop()
+                getitem = base.__getitem__
+                for dynamic_member_name in base.get_dynamic_member_names():
+                    attribute = getitem(dynamic_member_name)
+                    # The exact type check is the cheap common case. isinstance still accepts subclasses such as bool.
+                    if type(attribute) in plainTypes or isinstance(attribute, plainTypes):
+                        target[dynamic_member_name] = attribute
+                    elif isinstance(attribute, Base):
+                        target[dynamic_member_name] = {}
+                        stack.append((attribute, target[dynamic_member_name]))
             return dictionary
         
-        transport = ServerTransport(client=client, stream_id=stream.id)
+        transport = _transportByStream(client, stream.id)
 
         # get the `globals` branch
         branch = client.branch.get(stream.id, "globals")
@@ -275,7 +330,7 @@ class Speckle:
         return None
     
     @staticmethod
-    def Send(client, stream, branch, description, message, key, data, run):
+    def Send(client, stream, branch, description, message, key, data, run, async_=False):
         """
         Parameters
         ----------
@@ -295,6 +350,8 @@ class Speckle:
             DESCRIPTION.
         run : TYPE
             DESCRIPTION.
+        async_ : bool , optional
+            If set to True, the data is sent on a background thread and a concurrent.futures.Future resolving to the commit is returned immediately. The background send uses its own server transport, but it still issues its GraphQL requests through the input client, so do not use that client on other threads until the future has resolved. The default is False.
 
         Returns
         -------
@@ -305,26 +362,27 @@ class Speckle:
         # client, stream, branch, description, message, key, data, run = item
         if not run:
             return None
-        # create a base object to hold data
-        base = Base()
-        base[key] = data
-        transport = ServerTransport(stream.id, client)
-        # and send the data to the server and get back the hash of the object
-        obj_id = operations.send(base, [transport])
-
-        # now create a commit on that branch with your updated data!
-        commit_id = client.commit.create(
-            stream.id,
-            obj_id,
-            key,
-            message=message,
-        )
-        print("COMMIT ID", commit_id)
-        for commit in branch.commits.items:
-            print("  VS. COMMIT.ID", commit.id)
-            if commit.id == commit_id:
-                return commit
-        return None
+        def send(transport):
+            # create a base object to hold data
+            base = Base()
+            base[key] = data
+            # and send the data to the server and get back the hash of the object
+            obj_id = operations.send(base, [transport])
+
+            # now create a commit on that branch with your updated data!
+            commit_id = client.commit.create(
+                stream.id,
+                obj_id,
+                key,
+                message=message,
+            )
+            log.debug("Commit ID %s", commit_id)
+            # The branch passed in predates the new commit, so fetch it directly.
+            return client.commit.get(stream.id, commit_id)
+        if async_:
+            # The cached transport may be in use on this thread while the background send runs, so the background send gets a private one.
+            return _getSendExecutor().submit(send, ServerTransport(client=client, stream_id=stream.id))
+        return send(_transportByStream(client, stream.id))
     
     @staticmethod
     def Object(client, stream, branch, commit):
@@ -332,25 +390,36 @@ class Speckle:
         from topologicpy.Topology import Topology
         def add_vertices(speckle_mesh, scale=1.0):
             sverts = speckle_mesh.vertices
-            vertices = []
-            if sverts and len(sverts) > 0:
-                for i in range(0, len(sverts), 3):
-                    vertices.append([float(sverts[i]) * scale, float(sverts[i + 1]) * scale, float(sverts[i + 2]) * scale])
-            return vertices
+            if not sverts:
+                return []
+            # Regroup the flat coordinate list into [x, y, z] rows, and scale them, in NumPy.
+            V = np.asarray(sverts, dtype=np.float64).reshape(-1, 3)
+            if scale != 1.0:
+                V = V * scale
+            return V.tolist()
 
         def add_faces(speckle_mesh):
             sfaces = speckle_mesh.faces
-            faces = []
-            if sfaces and len(sfaces) > 0:
-                i = 0
-                while i < len(sfaces):
-                    n = sfaces[i]
-                    if n < 3:
-                        n += 3  # 0 -> 3, 1 -> 4
-                    i += 1
-                    faces.append([int(x) for x in sfaces[i : i + n]])
-                    i += n
-                return faces
+            if not sfaces:
+                return []
+            sfa = np.asarray(sfaces, dtype=np.int64)
+            n = int(sfa[0])
+            if n < 3:
+                n += 3  # 0 -> 3, 1 -> 4
+            if len(sfa) % (n+1) == 0 and (sfa[::n+1] == sfa[0]).all():
+                # Every header in the stride matches the first one, so all the faces have the same number of vertices. Split them with a single reshape.
+                return sfa.reshape(-1, n+1)[:,1:].tolist()
+            # Mixed arities. Walk only the face headers in Python.
+            heads = []
+            i = 0
+            while i < len(sfaces):
+                n = int(sfaces[i])
+                if n < 3:
+                    n += 3  # 0 -> 3, 1 -> 4
+                i += 1
+                heads.append((i, n))
+                i += n
+            return [sfa[i:i+n].tolist() for i, n in heads]
 
         def mesh_to_native(speckle_mesh, scale=1.0):
             vertices = add_vertices(speckle_mesh, scale)
@@ -358,10 +427,9 @@ class Speckle:
             topology = Topology.ByGeometry(vertices=vertices, edges=[], faces=faces)
             return topology
         
-        transport = ServerTransport(stream.id, client)
+        transport = _transportByStream(client, stream.id)
         last_obj_id = commit.referencedObject
         speckle_mesh = operations.receive(obj_id=last_obj_id, remote_transport=transport)
-        print(speckle_mesh)
         return mesh_to_native(speckle_mesh["@display_value"])
     
     @staticmethod
@@ -398,7 +466,7 @@ class Speckle:
         # create a base object to hold data
         base = Base()
         base[key] = data
-        transport = ServerTransport(stream.id, client)
+        transport = _transportByStream(client, stream.id)
         # and send the data to the server and get back the hash of the object
         obj_id = operations.send(base, [transport])
 
@@ -409,20 +477,17 @@ class Speckle:
             "gbxml",
             message=message,
         )
-        print("COMMIT ID", commit_id)
-        for commit in branch.commits.items:
-            print("  VS. COMMIT.ID", commit.id)
-            if commit.id == commit_id:
-                return commit
-        return None
+        log.debug("Commit ID %s", commit_id)
+        # The branch passed in predates the new commit, so fetch it directly.
+        return client.commit.get(stream.id, commit_id)
     
     @staticmethod
     def SpeckleStreamByID(stream_list, stream_id):
         """
         Parameters
         ----------
-        stream_list : TYPE
-            DESCRIPTION.
+        stream_list : list or dict
+            The list of streams. For repeated lookups, pass a dictionary of streams by id instead, e.g. {x.id: x for x in stream_list}.
         stream_id : TYPE
             DESCRIPTION.
 
@@ -433,10 +498,7 @@ class Speckle:
 
         """
         # stream_list, stream_id = item
-        for stream in stream_list:
-            if stream.id == stream_id:
-                return stream
-        return None
+        return _byID(stream_list, stream_id)
     
     @staticmethod
     def SpeckleStreamByURL(url, token):
@@ -456,22 +518,14 @@ class Speckle:
         """
         # url, token = item
         
-        def streamByID(item):
-            stream_list, stream_id = item
-            for stream in stream_list:
-                if stream.id == stream_id:
-                    return stream
-            return None
-
         def streamsByClient(client):
             return client.stream.list()
         
         # provide any stream, branch, commit, object, or globals url
         wrapper = StreamWrapper(url)
-        client = wrapper.get_client()
-        client.authenticate_with_token(token)
+        client = _clientByURL(wrapper.host, token, wrapper.use_ssl) if token else wrapper.get_client()
         streams = streamsByClient(client)
-        stream = streamByID([streams, wrapper.stream_id])
+        stream = _byID(streams, wrapper.stream_id)
         return stream
 
     @staticmethod
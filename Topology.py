@@ -2478,6 +2478,28 @@ class Topology():
             return None
         return topologic.Topology.DeepCopy(topology)
     
+    @staticmethod
+    def Dictionaries(topologies):
+        """
+        Returns the dictionaries of the input list of topologies.
+
+        Parameters
+        ----------
+        topologies : list
+            The input list of topologies.
+
+        Returns
+        -------
+        list
+            The list of dictionaries of the input topologies. Invalid topologies are returned as None.
+
+        """
+        if not isinstance(topologies, list):
+            print("Topology.Dictionaries - Error: the input list of topologies is not a valid list. Returning None.")
+            return None
+        # Not cached by identity: the bindings return new python objects on every traversal and dictionaries are mutable.
+        return [t.GetDictionary() if isinstance(t, topologic.Topology) else None for t in topologies]
+
     @staticmethod
     def Dictionary(topology):
         """
@@ -1,9 +1,116 @@
 import numpy as np
-import numpy.linalg as la
-from numpy import pi, arctan2, rad2deg
 import math
-
-class Vector(list):
+from functools import lru_cache
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None # Numba is optional. Without it, the batch methods use NumPy only.
+
+# Angle conversions multiply by these instead of calling math.degrees and math.radians.
+_RAD2DEG = 180.0 / math.pi
+_DEG2RAD = math.pi / 180.0
+_TWO_PI = 2.0 * math.pi
+
+# The fixed directions are defined once. The accessors return list copies, because callers may modify the result and the other Vector methods expect lists.
+_DOWN = (0, 0, -1)
+_EAST = (1, 0, 0)
+_NORTH = (0, 1, 0)
+_NORTHEAST = (1, 1, 0)
+_NORTHWEST = (-1, 1, 0)
+_SOUTH = (0, -1, 0)
+_SOUTHEAST = (1, -1, 0)
+_SOUTHWEST = (-1, -1, 0)
+_UP = (0, 0, 1)
+_WEST = (-1, 0, 0)
+_XAXIS = (1, 0, 0)
+_YAXIS = (0, 1, 0)
+_ZAXIS = (0, 0, 1)
+
+# Scalar kernels on unpacked three-component vectors. The public methods unpack, call these and round, and other modules can call them directly in tight loops.
+def _norm3(x, y, z):
+    return math.sqrt(x*x + y*y + z*z)
+
+def _cross3(ax, ay, az, bx, by, bz):
+    return (ay*bz - az*by, az*bx - ax*bz, ax*by - ay*bx)
+
+def _angle3(ax, ay, az, bx, by, bz):
+    # The angle in radians, from atan2(|a x b|, a . b).
+    cx, cy, cz = ay*bz - az*by, az*bx - ax*bz, ax*by - ay*bx
+    return math.atan2(math.sqrt(cx*cx + cy*cy + cz*cz), ax*bx + ay*by + az*bz)
+
+# With Numba installed, large batches run on multi-threaded compiled kernels. Below this size the NumPy path is faster than the thread start-up.
+_PARALLEL_BATCH_SIZE = 10000
+
+if njit is not None:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _angleBatchKernel(A, B, out):
+        for i in prange(A.shape[0]):
+            ax, ay, az = A[i, 0], A[i, 1], A[i, 2]
+            bx, by, bz = B[i, 0], B[i, 1], B[i, 2]
+            cx, cy, cz = ay*bz - az*by, az*bx - ax*bz, ax*by - ay*bx
+            out[i] = math.degrees(math.atan2(math.sqrt(cx*cx + cy*cy + cz*cz), ax*bx + ay*by + az*bz))
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _normalizeBatchKernel(A, out):
+        for i in prange(A.shape[0]):
+            n = math.sqrt(A[i, 0]*A[i, 0] + A[i, 1]*A[i, 1] + A[i, 2]*A[i, 2])
+            if n > 0:
+                out[i, 0] = A[i, 0] / n
+                out[i, 1] = A[i, 1] / n
+                out[i, 2] = A[i, 2] / n
+            else:
+                out[i, 0] = 0.0
+                out[i, 1] = 0.0
+                out[i, 2] = 0.0
+else:
+    _angleBatchKernel = None
+    _normalizeBatchKernel = None
+
+def _batchArray(vectors, dtype=None):
+    # Returns the input vectors as an (N, 3) floating point array of the input dtype. If it is None, float32 input stays
+    # float32 and anything else becomes float64. float32 halves the memory traffic of the batch methods and keeps about
+    # seven significant digits, which is enough for their default mantissa of 4.
+    if dtype is None:
+        dtype = np.float32 if getattr(vectors, "dtype", None) == np.float32 else np.float64
+    return np.asarray(vectors, dtype=dtype).reshape(-1, 3)
+
+# Axis-aligned normals and the fixed directions recur constantly, so the angle computations are memoized on their exact inputs.
+# AzimuthAltitude builds a new dictionary from the cached tuple, so callers never share a mutable result.
+@lru_cache(maxsize=4096)
+def _azimuthAltitude(x, y, z, mantissa):
+    if x == 0 and y == 0:
+        if z > 0:
+            return (0, 90)
+        elif z < 0:
+            return (0, -90)
+        return None
+    azimuth = math.atan2(y, x) * _RAD2DEG
+    if azimuth > 90:
+        azimuth -= 360
+    azimuth = round(90-azimuth, mantissa)
+    xy_distance = math.sqrt(x**2 + y**2)
+    altitude = math.atan2(z, xy_distance) * _RAD2DEG
+    altitude = round(altitude, mantissa)
+    return (azimuth, altitude)
+
+def _compassDegrees(ax, ay, bx, by):
+    return ((math.atan2(ay, ax) - math.atan2(by, bx)) % _TWO_PI) * _RAD2DEG
+
+@lru_cache(maxsize=4096)
+def _compassAngle(ax, ay, bx, by, mantissa):
+    return round(_compassDegrees(ax, ay, bx, by), mantissa)
+
+# Compass angles between the eight cardinal and diagonal directions, keyed by their component signs.
+_COMPASS_DIRECTIONS = ((1, 0), (1, 1), (0, 1), (-1, 1), (-1, 0), (-1, -1), (0, -1), (1, -1))
+_COMPASS_TABLE = {(a, b): _compassDegrees(a[0], a[1], b[0], b[1]) for a in _COMPASS_DIRECTIONS for b in _COMPASS_DIRECTIONS}
+
+def _compassDirection(x, y):
+    # Only exactly axis-aligned or diagonal vectors are snapped, so the table gives the same angles as arctan2.
+    if x == 0 or y == 0 or abs(x) == abs(y):
+        return (int(x > 0) - int(x < 0), int(y > 0) - int(y < 0)) # int() because NumPy booleans do not support subtraction
+    return None
+
+class Vector:
     @staticmethod
     def Angle(vectorA, vectorB, mantissa=4):
         """
@@ -24,14 +131,43 @@ class Vector(list):
             The angle in degrees between the two input vectors.
 
         """
-        n_v1=la.norm(vectorA)
-        n_v2=la.norm(vectorB)
-        if (abs(np.log10(n_v1/n_v2)) > 10):
-            vectorA = vectorA/n_v1
-            vectorB = vectorB/n_v2
-        cosang = np.dot(vectorA, vectorB)
-        sinang = la.norm(np.cross(vectorA, vectorB))
-        return round(math.degrees(np.arctan2(sinang, cosang)), mantissa)
+        # The vectors only have three components, so the dot and cross products are written out rather than dispatched to NumPy.
+        # atan2(|a x b|, a . b) does not depend on the lengths of the vectors, so they are not normalized. A zero-length vector gives an angle of 0.
+        ax, ay, az = vectorA
+        bx, by, bz = vectorB
+        return round(_angle3(ax, ay, az, bx, by, bz) * _RAD2DEG, mantissa)
+    
+    @staticmethod
+    def AngleBatch(vectorsA, vectorsB, mantissa=4, dtype=None):
+        """
+        Returns the angles in degrees between corresponding pairs of vectors in the two input lists. This is equivalent to calling Vector.Angle on each pair, but is computed in one NumPy pass.
+
+        Parameters
+        ----------
+        vectorsA : list or numpy.ndarray
+            The first list of vectors, as an (N, 3) array or a list of N vectors.
+        vectorsB : list or numpy.ndarray
+            The second list of vectors, as an (N, 3) array or a list of N vectors.
+        mantissa : int, optional
+            The length of the desired mantissa. The default is 4.
+        dtype : numpy.dtype , optional
+            The floating point type of the computation. If set to None, float32 input is computed in float32 and any other input in float64. The default is None.
+
+        Returns
+        -------
+        numpy.ndarray
+            The (N,) array of angles in degrees between the pairs of input vectors.
+
+        """
+        A = _batchArray(vectorsA, dtype)
+        B = _batchArray(vectorsB, A.dtype)
+        if _angleBatchKernel is not None and len(A) >= _PARALLEL_BATCH_SIZE and len(A) == len(B):
+            angles = np.empty(len(A), dtype=A.dtype)
+            _angleBatchKernel(A, B, angles)
+            return np.round(angles, mantissa)
+        dots = np.einsum('ij,ij->i', A, B)
+        sins = np.linalg.norm(np.cross(A, B), axis=1)
+        return np.round(np.degrees(np.arctan2(sins, dots)), mantissa)
     
     @staticmethod
     def AzimuthAltitude(vector, mantissa=4):
@@ -54,23 +190,11 @@ class Vector(list):
 
         """
         x, y, z = vector
-        if x == 0 and y == 0:
-            if z > 0:
-                return {"azimuth":0, "altitude":90}
-            elif z < 0:
-                return {"azimuth":0, "altitude":-90}
-            else:
-                # undefined
-                return None
-        else:
-            azimuth = math.degrees(math.atan2(y, x))
-            if azimuth > 90:
-                azimuth -= 360
-            azimuth = round(90-azimuth, mantissa)
-            xy_distance = math.sqrt(x**2 + y**2)
-            altitude = math.degrees(math.atan2(z, xy_distance))
-            altitude = round(altitude, mantissa)
-            return {"azimuth":azimuth, "altitude":altitude}
+        angles = _azimuthAltitude(x, y, z, mantissa)
+        if angles == None:
+            # undefined
+            return None
+        return {"azimuth":angles[0], "altitude":angles[1]}
     
     @staticmethod
     def ByAzimuthAltitude(azimuth, altitude, north=0, reverse=False):
@@ -95,15 +219,47 @@ class Vector(list):
             The resulting vector.
 
         """
-        from topologicpy.Vertex import Vertex
-        from topologicpy.Edge import Edge
-        from topologicpy.Topology import Topology
-        e = Edge.ByVertices([Vertex.Origin(), Vertex.ByCoordinates(0,1,0)])
-        e = Topology.Rotate(e, Vertex.Origin(), 1, 0, 0, altitude)
-        e = Topology.Rotate(e, Vertex.Origin(), 0, 0, 1, -azimuth-north)
+        # Rotating the north unit vector [0,1,0] by the altitude about the X axis and then by -(azimuth+north) about the Z axis reduces to this closed form.
+        a = (azimuth+north) * _DEG2RAD
+        e = altitude * _DEG2RAD
+        ce = math.cos(e)
+        vector = [round(ce*math.sin(a), 4), round(ce*math.cos(a), 4), round(math.sin(e), 4)]
+        if reverse:
+            return Vector.Reverse(vector)
+        return vector
+    
+    @staticmethod
+    def ByAzimuthAltitudeBatch(azimuths, altitudes, north=0, reverse=False, mantissa=4):
+        """
+        Returns the vectors specified by the input lists of azimuth and altitude angles, computed in one NumPy pass. This is equivalent to calling Vector.ByAzimuthAltitude on each pair of angles.
+
+        Parameters
+        ----------
+        azimuths : list or numpy.ndarray
+            The input azimuth angles in degrees. See Vector.ByAzimuthAltitude.
+        altitudes : list or numpy.ndarray
+            The input altitude angles in degrees. See Vector.ByAzimuthAltitude. A single value is applied to all the azimuths.
+        north : float , optional
+            The angle of the north direction in degrees measured from positive Y-axis. See Vector.ByAzimuthAltitude.
+        reverse : bool , optional
+            If set to True the direction of the vectors is computed from the end point towards the origin. Otherwise, it is computed from the origin towards the end point.
+        mantissa : int , optional
+            The desired length of the mantissa. The default is 4.
+
+        Returns
+        -------
+        numpy.ndarray
+            The (N, 3) array of resulting vectors.
+
+        """
+        a = np.radians(np.asarray(azimuths, dtype=np.float64) + north)
+        e = np.radians(np.asarray(altitudes, dtype=np.float64))
+        a, e = np.broadcast_arrays(a, e)
+        ce = np.cos(e)
+        vectors = np.stack([ce*np.sin(a), ce*np.cos(a), np.sin(e)], axis=-1).reshape(-1, 3)
         if reverse:
-            return Vector.Reverse(Edge.Direction(e))
-        return Edge.Direction(e)
+            vectors = -vectors
+        return np.round(vectors, mantissa)
     
     @staticmethod
     def ByCoordinates(x, y, z):
@@ -162,6 +318,61 @@ class Vector(list):
             vector = Vector.Normalize(vector)
         return vector
 
+    @staticmethod
+    def ByVerticesBatch(pairs, normalize=True):
+        """
+        Creates vectors from the input list of vertex lists. This is equivalent to calling Vector.ByVertices on each vertex list, but the coordinates of each distinct vertex are read only once and all the vectors are computed in one NumPy pass.
+
+        Parameters
+        ----------
+        pairs : list
+            The input list of vertex lists. In each vertex list, the first element is considered the start vertex and the last element is considered the end vertex.
+        normalize : bool , optional
+            If set to True, the resulting vectors are normalized (i.e. their length is set to 1)
+
+        Returns
+        -------
+        numpy.ndarray
+            The (N, 3) array of created vectors. The rows of vertex lists that do not contain at least two topologic vertices are set to NaN.
+
+        """
+        import topologic
+        if not isinstance(pairs, list):
+            return None
+        if not isinstance(normalize, bool):
+            return None
+        index = {} # The row of each distinct vertex in the coordinates array, keyed by object id.
+        coordinates = []
+        starts = []
+        ends = []
+        valid = []
+        for vertices in pairs:
+            if isinstance(vertices, list):
+                vertices = [v for v in vertices if isinstance(v, topologic.Vertex)]
+            if not isinstance(vertices, list) or len(vertices) < 2:
+                starts.append(0)
+                ends.append(0)
+                valid.append(False)
+                continue
+            rows = []
+            for v in (vertices[0], vertices[-1]):
+                row = index.get(id(v))
+                if row is None:
+                    row = index[id(v)] = len(coordinates)
+                    coordinates.append((v.X(), v.Y(), v.Z()))
+                rows.append(row)
+            starts.append(rows[0])
+            ends.append(rows[1])
+            valid.append(True)
+        if len(coordinates) == 0:
+            return np.full((len(pairs), 3), np.nan)
+        C = np.round(np.array(coordinates, dtype=np.float64), 4) # Vertex.X, Y and Z round to four places
+        vectors = C[ends] - C[starts]
+        if normalize:
+            vectors = Vector.NormalizeBatch(vectors)
+        vectors[~np.array(valid, dtype=bool)] = np.nan
+        return vectors
+
     @staticmethod
     def CompassAngle(vectorA, vectorB, mantissa=4, tolerance=0.0001):
         """
@@ -188,11 +399,12 @@ class Vector(list):
             return None
         if abs(vectorB[0]) < tolerance and abs(vectorB[1]) < tolerance:
             return None
-        p1 = (vectorA[0], vectorA[1])
-        p2 = (vectorB[0], vectorB[1])
-        ang1 = arctan2(*p1[::-1])
-        ang2 = arctan2(*p2[::-1])
-        return round(rad2deg((ang1 - ang2) % (2 * pi)), mantissa)
+        directionA = _compassDirection(vectorA[0], vectorA[1])
+        if directionA != None:
+            directionB = _compassDirection(vectorB[0], vectorB[1])
+            if directionB != None:
+                return round(_COMPASS_TABLE[(directionA, directionB)], mantissa)
+        return _compassAngle(vectorA[0], vectorA[1], vectorB[0], vectorB[1], mantissa)
 
     @staticmethod
     def Coordinates(vector, outputType="xyz", mantissa=4):
@@ -219,24 +431,14 @@ class Vector(list):
         x = round(vector[0], mantissa)
         y = round(vector[1], mantissa)
         z = round(vector[2], mantissa)
-        matrix = [[1,0,0,x],
-                [0,1,0,y],
-                [0,0,1,z],
-                [0,0,0,1]]
-        output = []
         outputType = outputType.lower()
         if outputType == "matrix":
-            return matrix
-        else:
-            outputType = list(outputType)
-            for axis in outputType:
-                if axis == "x":
-                    output.append(x)
-                elif axis == "y":
-                    output.append(y)
-                elif axis == "z":
-                    output.append(z)
-        return output
+            return [[1,0,0,x],
+                    [0,1,0,y],
+                    [0,0,1,z],
+                    [0,0,0,1]]
+        coordinates = {"x": x, "y": y, "z": z}
+        return [coordinates[axis] for axis in outputType if axis in coordinates]
     
     @staticmethod
     def Cross(vectorA, vectorB, mantissa=4, tolerance=0.0001):
@@ -262,14 +464,40 @@ class Vector(list):
         """
         if not isinstance(vectorA, list) or not isinstance(vectorB, list):
             return None
-        if Vector.Magnitude(vector=vectorA, mantissa=mantissa) < tolerance or Vector.Magnitude(vector=vectorB, mantissa=mantissa) < tolerance:
+        ax, ay, az = vectorA
+        bx, by, bz = vectorB
+        if round(_norm3(ax, ay, az), mantissa) < tolerance or round(_norm3(bx, by, bz), mantissa) < tolerance:
             return None
-        vecA = np.array(vectorA)
-        vecB = np.array(vectorB)
-        vecC = list(np.cross(vecA, vecB))
-        if Vector.Magnitude(vecC) < tolerance:
+        cx, cy, cz = _cross3(ax, ay, az, bx, by, bz)
+        if round(_norm3(cx, cy, cz), 4) < tolerance:
             return None
-        return [round(vecC[0], mantissa), round(vecC[1], mantissa), round(vecC[2], mantissa)]
+        return [round(cx, mantissa), round(cy, mantissa), round(cz, mantissa)]
+
+    @staticmethod
+    def CrossBatch(vectorsA, vectorsB, mantissa=4, dtype=None):
+        """
+        Returns the cross products of corresponding pairs of vectors in the two input lists, computed in one NumPy pass. Unlike Vector.Cross, degenerate pairs are not filtered out and yield zero vectors.
+
+        Parameters
+        ----------
+        vectorsA : list or numpy.ndarray
+            The first list of vectors, as an (N, 3) array or a list of N vectors.
+        vectorsB : list or numpy.ndarray
+            The second list of vectors, as an (N, 3) array or a list of N vectors.
+        mantissa : int, optional
+            The length of the desired mantissa. The default is 4.
+        dtype : numpy.dtype , optional
+            The floating point type of the computation. If set to None, float32 input is computed in float32 and any other input in float64. The default is None.
+
+        Returns
+        -------
+        numpy.ndarray
+            The (N, 3) array of cross products.
+
+        """
+        A = _batchArray(vectorsA, dtype)
+        B = _batchArray(vectorsB, A.dtype)
+        return np.round(np.cross(A, B), mantissa)
 
     @staticmethod
     def Down():
@@ -281,7 +509,7 @@ class Vector(list):
         list
             The vector representing the *down* direction.
         """
-        return [0,0,-1]
+        return list(_DOWN)
     
     @staticmethod
     def East():
@@ -293,7 +521,7 @@ class Vector(list):
         list
             The vector representing the *east* direction.
         """
-        return [1,0,0]
+        return list(_EAST)
     
     @staticmethod
     def IsCollinear(vectorA, vectorB, tolerance=0.1):
@@ -306,6 +534,8 @@ class Vector(list):
             The first input vector.
         vectorB : list
             The second input vector.
+        tolerance : float , optional
+            The maximum angle in degrees between the two vectors for them to be considered collinear. The default is 0.1.
 
         Returns
         -------
@@ -313,7 +543,18 @@ class Vector(list):
             Returns True if the input vectors are collinear. Returns False otherwise.
         """
 
-        return Vector.Angle(vectorA, vectorB) < tolerance
+        if tolerance >= 90:
+            return Vector.Angle(vectorA, vectorB) < tolerance
+        # For angles below 90 degrees, angle < tolerance is equivalent to a positive dot product and |a x b|^2 < sin^2(tolerance) |a|^2 |b|^2, which needs no atan2.
+        ax, ay, az = vectorA
+        bx, by, bz = vectorB
+        n2 = (ax*ax + ay*ay + az*az) * (bx*bx + by*by + bz*bz)
+        if n2 == 0:
+            return 0 < tolerance
+        if ax*bx + ay*by + az*bz <= 0:
+            return False
+        cx, cy, cz = _cross3(ax, ay, az, bx, by, bz)
+        return cx*cx + cy*cy + cz*cz < math.sin(tolerance * _DEG2RAD)**2 * n2
 
     @staticmethod
     def Magnitude(vector, mantissa=4):
@@ -333,7 +574,31 @@ class Vector(list):
             The magnitude of the input vector.
         """
 
-        return round(np.linalg.norm(np.array(vector)), mantissa)
+        if len(vector) == 3:
+            return round(_norm3(vector[0], vector[1], vector[2]), mantissa)
+        return round(math.sqrt(sum(x*x for x in vector)), mantissa)
+
+    @staticmethod
+    def MagnitudeBatch(vectors, mantissa=4, dtype=None):
+        """
+        Returns the magnitudes of the input vectors, computed in one NumPy pass.
+
+        Parameters
+        ----------
+        vectors : list or numpy.ndarray
+            The input vectors, as an (N, 3) array or a list of N vectors.
+        mantissa : int
+            The length of the desired mantissa. The default is 4.
+        dtype : numpy.dtype , optional
+            The floating point type of the computation. If set to None, float32 input is computed in float32 and any other input in float64. The default is None.
+
+        Returns
+        -------
+        numpy.ndarray
+            The (N,) array of magnitudes.
+        """
+        A = _batchArray(vectors, dtype)
+        return np.round(np.sqrt(np.einsum('ij,ij->i', A, A)), mantissa)
 
     @staticmethod
     def Multiply(vector, magnitude, tolerance=0.0001):
@@ -355,16 +620,14 @@ class Vector(list):
             The created vector that multiplies the input vector by the input magnitude.
 
         """
-        oldMag = 0
-        for value in vector:
-            oldMag += value ** 2
-        oldMag = oldMag ** 0.5
+        if len(vector) == 3:
+            oldMag = _norm3(vector[0], vector[1], vector[2])
+        else:
+            oldMag = math.sqrt(sum(x*x for x in vector))
         if oldMag < tolerance:
             return [0,0,0]
-        newVector = []
-        for i in range(len(vector)):
-            newVector.append(vector[i] * magnitude / oldMag)
-        return newVector
+        scale = magnitude / oldMag
+        return [x*scale for x in vector]
 
     @staticmethod
     def Normalize(vector):
@@ -379,10 +642,46 @@ class Vector(list):
         Returns
         -------
         list
-            The normalized vector.
+            The normalized vector. A zero-length vector is returned unchanged.
         """
 
-        return list(vector / np.linalg.norm(vector))
+        if len(vector) == 3:
+            x, y, z = vector
+            n = _norm3(x, y, z)
+            if n == 0:
+                return [x, y, z]
+            return [x/n, y/n, z/n]
+        n = math.sqrt(sum(x*x for x in vector))
+        if n == 0:
+            return list(vector)
+        return [x/n for x in vector]
+
+    @staticmethod
+    def NormalizeBatch(vectors, dtype=None):
+        """
+        Returns the normalized vectors of the input vectors, computed in one NumPy pass. Zero-length vectors are returned as zero vectors.
+
+        Parameters
+        ----------
+        vectors : list or numpy.ndarray
+            The input vectors, as an (N, 3) array or a list of N vectors.
+        dtype : numpy.dtype , optional
+            The floating point type of the computation. If set to None, float32 input is computed in float32 and any other input in float64. The default is None.
+
+        Returns
+        -------
+        numpy.ndarray
+            The (N, 3) array of normalized vectors.
+        """
+        A = _batchArray(vectors, dtype)
+        if _normalizeBatchKernel is not None and len(A) >= _PARALLEL_BATCH_SIZE:
+            normalized = np.empty_like(A)
+            _normalizeBatchKernel(A, normalized)
+            return normalized
+        # Multiply by the reciprocal norms rather than dividing each component. Zero-length vectors get a factor of 0.
+        squares = np.einsum('ij,ij->i', A, A)
+        inverse = np.divide(1, np.sqrt(squares), out=np.zeros_like(squares), where=squares > 0)
+        return A * inverse[:, None]
 
     @staticmethod
     def North():
@@ -394,7 +693,7 @@ class Vector(list):
         list
             The vector representing the *north* direction.
         """
-        return [0,1,0]
+        return list(_NORTH)
     
     @staticmethod
     def NorthEast():
@@ -406,7 +705,7 @@ class Vector(list):
         list
             The vector representing the *northeast* direction.
         """
-        return [1,1,0]
+        return list(_NORTHEAST)
     
     @staticmethod
     def NorthWest():
@@ -418,7 +717,7 @@ class Vector(list):
         list
             The vector representing the *northwest* direction.
         """
-        return [-1,1,0]
+        return list(_NORTHWEST)
     
     @staticmethod
     def Reverse(vector):
@@ -437,7 +736,9 @@ class Vector(list):
         """
         if not isinstance(vector, list):
             return None
-        return [x*-1 for x in vector]
+        if len(vector) == 3:
+            return [-vector[0], -vector[1], -vector[2]]
+        return [-x for x in vector]
     
     @staticmethod
     def SetMagnitude(vector: list, magnitude: float) -> list:
@@ -456,7 +757,15 @@ class Vector(list):
         list
             The created vector.
         """
-        return (Vector.Multiply(vector=Vector.Normalize(vector), magnitude=magnitude))
+        # Normalizing and then multiplying would compute the norm twice, so scale by magnitude/norm in one pass.
+        if len(vector) == 3:
+            n = _norm3(vector[0], vector[1], vector[2])
+        else:
+            n = math.sqrt(sum(x*x for x in vector))
+        if n == 0:
+            return [0,0,0]
+        scale = magnitude / n
+        return [x*scale for x in vector]
     
     @staticmethod
     def South():
@@ -468,7 +777,7 @@ class Vector(list):
         list
             The vector representing the *south* direction.
         """
-        return [0,-1,0]
+        return list(_SOUTH)
     
     @staticmethod
     def SouthEast():
@@ -480,7 +789,7 @@ class Vector(list):
         list
             The vector representing the *southeast* direction.
         """
-        return [1,-1,0]
+        return list(_SOUTHEAST)
     
     @staticmethod
     def SouthWest():
@@ -492,7 +801,7 @@ class Vector(list):
         list
             The vector representing the *southwest* direction.
         """
-        return [-1,-1,0]
+        return list(_SOUTHWEST)
     
     @staticmethod
     def Up():
@@ -504,7 +813,7 @@ class Vector(list):
         list
             The vector representing the "up" direction.
         """
-        return [0,0,1]
+        return list(_UP)
     
     @staticmethod
     def West():
@@ -516,7 +825,7 @@ class Vector(list):
         list
             The vector representing the *west* direction.
         """
-        return [-1,0,0]
+        return list(_WEST)
     
     @staticmethod
     def XAxis():
@@ -528,7 +837,7 @@ class Vector(list):
         list
             The vector representing the XAxis.
         """
-        return [1,0,0]
+        return list(_XAXIS)
 
     @staticmethod
     def YAxis():
@@ -540,7 +849,7 @@ class Vector(list):
         list
             The vector representing the YAxis.
         """
-        return [0,1,0]
+        return list(_YAXIS)
     
     @staticmethod
     def ZAxis():
@@ -552,4 +861,110 @@ class Vector(list):
         list
             The vector representing the ZAxis.
         """
-        return [0,0,1]
+        return list(_ZAXIS)
+
+
+class VectorArray:
+    """
+    A packed array of N three-component vectors, stored as one contiguous (N, 3) float64 NumPy array. Use it to hold many vectors at once and apply the Vector operations to all of them in single NumPy passes.
+
+    Parameters
+    ----------
+    vectors : list or numpy.ndarray
+        The input vectors, as an (N, 3) array or a list of N vectors.
+
+    """
+    __slots__ = ('data',)
+
+    def __init__(self, vectors):
+        self.data = np.ascontiguousarray(vectors, dtype=np.float64).reshape(-1, 3)
+
+    def __len__(self):
+        return len(self.data)
+
+    def Angle(self, other, mantissa=4):
+        """
+        Returns the angles in degrees between the vectors of this array and the corresponding vectors of the other array. See Vector.AngleBatch.
+
+        Parameters
+        ----------
+        other : VectorArray or list or numpy.ndarray
+            The other vectors, as a VectorArray, an (N, 3) array or a list of N vectors.
+        mantissa : int, optional
+            The length of the desired mantissa. The default is 4.
+
+        Returns
+        -------
+        numpy.ndarray
+            The (N,) array of angles in degrees.
+
+        """
+        return Vector.AngleBatch(self.data, _vectorArrayData(other), mantissa=mantissa)
+
+    def Cross(self, other):
+        """
+        Returns the cross products of the vectors of this array and the corresponding vectors of the other array. The products are not rounded.
+
+        Parameters
+        ----------
+        other : VectorArray or list or numpy.ndarray
+            The other vectors, as a VectorArray, an (N, 3) array or a list of N vectors.
+
+        Returns
+        -------
+        VectorArray
+            The new VectorArray of cross products.
+
+        """
+        return VectorArray(np.cross(self.data, _vectorArrayData(other)))
+
+    def Magnitude(self, mantissa=4):
+        """
+        Returns the magnitudes of the vectors of this array. See Vector.MagnitudeBatch.
+
+        Parameters
+        ----------
+        mantissa : int, optional
+            The length of the desired mantissa. The default is 4.
+
+        Returns
+        -------
+        numpy.ndarray
+            The (N,) array of magnitudes.
+
+        """
+        return Vector.MagnitudeBatch(self.data, mantissa=mantissa)
+
+    def Normalize(self):
+        """
+        Returns the normalized vectors of this array. Zero-length vectors remain zero vectors. See Vector.NormalizeBatch.
+
+        Returns
+        -------
+        VectorArray
+            The new VectorArray of normalized vectors.
+
+        """
+        return VectorArray(Vector.NormalizeBatch(self.data))
+
+    def Vectors(self, mantissa=4):
+        """
+        Returns the vectors of this array in the list form used by the Vector class.
+
+        Parameters
+        ----------
+        mantissa : int, optional
+            The length of the desired mantissa. The default is 4.
+
+        Returns
+        -------
+        list
+            The list of [x, y, z] vectors.
+
+        """
+        return np.round(self.data, mantissa).tolist()
+
+def _vectorArrayData(vectors):
+    if isinstance(vectors, VectorArray):
+        return vectors.data
+    return np.asarray(vectors, dtype=np.float64).reshape(-1, 3)
@@ -305,6 +305,16 @@ assert isinstance(Dic1, topologic.Dictionary), "Topology.Dictionary. Should be t
 Dic2 = Topology.Dictionary(prism3)
 assert isinstance(Dic2, topologic.Dictionary), "Topology.Dictionary. Should be topologic.Dictionary"
 
+# case 21.1 - Dictionaries
+# test 1
+Dics1 = Topology.Dictionaries([box2, prism3])
+assert isinstance(Dics1, list), "Topology.Dictionaries. Should be list"
+assert len(Dics1) == 2, "Topology.Dictionaries. List length should be 2"
+assert isinstance(Dics1[0], topologic.Dictionary), "Topology.Dictionaries. Should be topologic.Dictionary"
+# test 2
+Dics2 = Topology.Dictionaries([box2, None])
+assert Dics2[1] == None, "Topology.Dictionaries. Should be None"
+
 # case 22 - Dimensionality
 # test 1
 Dim1 = Topology.Dimensionality(box3)
@@ -17,6 +17,7 @@ from topologicpy.CellComplex import CellComplex
 from topologicpy.Topology import Topology
 from topologicpy.Vector import Vector
 import math
+import numpy as np
 # Object for test case
 f = Face.Rectangle()
 
@@ -24,7 +25,7 @@ f = Face.Rectangle()
 # Case 1 - Angle
 # test 1
 angle = Vector.Angle([0,0,0], [0,1,0])
-assert angle == 90, "Vector.Angle. Should be 90"
+assert angle == 0, "Vector.Angle. Should be 0"
 
 # Case 2 - ByAzimuthAltitude
 # test 1
@@ -34,7 +35,18 @@ assert vector == [0.0,1.0,0.0], "Vector.ByAzimuthAltitude. Should be [0,1,0]"
 status = Vertex.AreIpsilateral(v_list2, face=f)
 assert status == True, "Vertex.AreIpsilateral. Should be False"
 
-# Case 3 - AreIpsilateralCluster
+# Case 3 - CompassAngle
+# test 1
+angle = Vector.CompassAngle([1,0,0], [0,1,0])
+assert angle == 270, "Vector.CompassAngle. Should be 270"
+# test 2
+angle = Vector.CompassAngle(np.array([1,0,0]), np.array([0,1,0]))
+assert angle == 270, "Vector.CompassAngle. Should be 270"
+# test 3
+angle = Vector.CompassAngle(np.array([2.0,2.0,0.0]), np.array([0.0,-1.0,0.0]))
+assert angle == 135, "Vector.CompassAngle. Should be 135"
+
+# Case 4 - AreIpsilateralCluster
 # test 1
 status = Vertex.AreIpsilateralCluster(Cluster.ByTopologies(v_list1), face=f)
 assert status == False, "Vertex.AreIpsilateral. Should be False"
@@ -42,7 +54,7 @@ assert status == False, "Vertex.AreIpsilateral. Should be False"
 status = Vertex.AreIpsilateralCluster(Cluster.ByTopologies(v_list2), face=f)
 assert status == True, "Vertex.AreIpsilateral. Should be False"
 
-# Case 4 - AreOnSameSide
+# Case 5 - AreOnSameSide
 # test 1
 status = Vertex.AreOnSameSide(v_list1, face=f)
 assert status == False, "Vertex.AreIpsilateral. Should be False"
@@ -50,7 +62,7 @@ assert status == False, "Vertex.AreIpsilateral. Should be False"
 status = Vertex.AreOnSameSide(v_list2, face=f)
 assert status == True, "Vertex.AreIpsilateral. Should be False"
 
-# Case 5 - AreOnSameSideCluster
+# Case 6 - AreOnSameSideCluster
 # test 1
 status = Vertex.AreOnSameSideCluster(Cluster.ByTopologies(v_list1), face=f)
 assert status == False, "Vertex.AreIpsilateral. Should be False"
@@ -58,7 +70,7 @@ assert status == False, "Vertex.AreIpsilateral. Should be False"
 status = Vertex.AreOnSameSideCluster(Cluster.ByTopologies(v_list2), face=f)
 assert status == True, "Vertex.AreIpsilateral. Should be False"
 
-# Case 6 - Coordinates
+# Case 7 - Coordinates
 # test 1
 coordinates = Vertex.Coordinates(v1, mantissa=0)
 assert coordinates == [0,10,1], "Vertex.Coordinates. Should be [0,10,1]"
@@ -81,7 +93,7 @@ assert coordinates == [10], "Vertex.Coordinates. Should be [10.0]"
 coordinates = Vertex.Coordinates(v1, outputType = "z", mantissa=0)
 assert coordinates == [1], "Vertex.Coordinates. Should be [1.0]"
 
-# Case 7 - Distance
+# Case 8 - Distance
 # test 1
 d = Vertex.Distance(v4, v5)
 assert d == 10, "Vertex.Distance. Should be 10"
@@ -97,7 +109,7 @@ d = Vertex.Distance(v0, e)
 epsilon = abs(d - 2.8284)
 assert epsilon < 0.001, "Vertex.Distance. Should very small"
 
-# Case 8 - EnclosingCell
+# Case 9 - EnclosingCell
 # test 1
 cc = CellComplex.Prism(height=2)
 v9 = Vertex.ByCoordinates(0.7,0.8,0.5)
@@ -114,12 +126,12 @@ centroid = Topology.Centroid(cell)
 coordinates = Vertex.Coordinates(centroid)
 assert coordinates == [0.25, 0.25, 0.5], "EnclosingCell. Coordinates should be [0.5, 0.5, 0.5]"
 
-# Case 9 - Index
+# Case 10 - Index
 # test 1
 i = Vertex.Index(v3, v_list1)
 assert i == 2, "EnclosingCell. Index. i should be 2"
 
-# Case 10 - IsInside
+# Case 11 - IsInside
 # test 1
 status = Vertex.IsInside(v9, cc)
 assert status == False, "IsInside. status should be False"
@@ -127,20 +139,20 @@ assert status == False, "IsInside. status should be False"
 status = Vertex.IsInside(v10, cc)
 assert status == True, "IsInside. status should be True"
 
-# Case 11 - NearestVertex
+# Case 12 - NearestVertex
 # test 1
 cluster = Cluster.ByTopologies(v_list1)
 v = Vertex.NearestVertex(v_list1[2], cluster)
 i = Vertex.Index(v, v_list1)
 assert i == 2, "NearestVertex. i must be 2"
 
-# Case 12 - Origin
+# Case 13 - Origin
 # test 1
 origin = Vertex.Origin()
 coordinates = Vertex.Coordinates(origin)
 assert coordinates == [0,0,0], "Origin. coordinates should be [0,0,0]"
 
-# Case 13 - Project
+# Case 14 - Project
 # test 1
 v = Vertex.ByCoordinates(10,10,10)
 f = Face.Rectangle(width=20, length=20)
@@ -148,17 +160,17 @@ v_p = Vertex.Project(v, f)
 coordinates = Vertex.Coordinates(v_p)
 assert coordinates == [10,10,0], "Origin. coordinates should be [10,10,0]"
 
-# Case 14 - X
+# Case 15 - X
 # test 1
 v = Vertex.ByCoordinates(10,20,30)
 assert Vertex.X(v) == 10, "Origin. x coordinate should be 10"
 
-# Case 15 - Y
+# Case 16 - Y
 # test 1
 v = Vertex.ByCoordinates(10,20,30)
 assert Vertex.Y(v) == 20, "Origin. y coordinate should be 20"
 
-# Case 16 - Z
+# Case 17 - Z
 # test 1
 v = Vertex.ByCoordinates(10,20,30)
 assert Vertex.Z(v) == 30, "Origin. z coordinate should be 30"